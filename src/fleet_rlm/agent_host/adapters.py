@@ -4,17 +4,36 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import AsyncIterator
+from dataclasses import replace
 
 from fleet_rlm.worker import WorkspaceEvent
 
+_MAX_COALESCED_TOKENS = 64
+
 
 async def iter_workspace_host_queue(
     queue: asyncio.Queue[WorkspaceEvent | None],
 ) -> AsyncIterator[WorkspaceEvent]:
-    """Yield worker-native events from the hosted queue until the sentinel arrives."""
+    """Yield worker-native events from the hosted queue until the sentinel arrives.
+
+    Assistant tokens already queued back to back are merged into one event,
+    so a burst of tokens costs one downstream send instead of one per token.
+    Nothing is held back waiting for more tokens to arrive.
+    """
 
+    held: list[WorkspaceEvent | None] = []
     while True:
-        event = await queue.get()
+        event = held.pop() if held else await queue.get()
         if event is None:
             return
+        if event.kind == "assistant_token" and not queue.empty():
+            chunks = [event.text]
+            while len(chunks) < _MAX_COALESCED_TOKENS and not queue.empty():
+                follower = queue.get_nowait()
+                if follower is None or follower.kind != "assistant_token":
+                    held.append(follower)
+                    break
+                chunks.append(follower.text)
+            if len(chunks) > 1:
+                event = replace(event, text="".join(chunks))
         yield event
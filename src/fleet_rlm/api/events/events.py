@@ -80,7 +80,7 @@ class ExecutionEventEmitter:
     @dataclass(slots=True)
     class _ConnectionState:
         subscription: ExecutionSubscription
-        queue: asyncio.Queue[dict[str, Any] | None]
+        queue: asyncio.Queue[str | None]
         sender_task: asyncio.Task[None]
         dropped_events: int = 0
 
@@ -99,9 +99,7 @@ class ExecutionEventEmitter:
         self, websocket: WebSocket, subscription: ExecutionSubscription
     ) -> None:
         await websocket.accept()
-        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(
-            maxsize=self._max_queue
-        )
+        queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=self._max_queue)
         sender_task = asyncio.create_task(self._sender_loop(websocket))
         state = self._ConnectionState(
             subscription=subscription,
@@ -150,23 +148,23 @@ class ExecutionEventEmitter:
             if state is None:
                 return
 
-            payload = await state.queue.get()
-            if payload is None:
+            message = await state.queue.get()
+            if message is None:
                 break
             try:
-                await websocket.send_json(payload)
+                await websocket.send_text(message)
             except Exception:
                 break
 
         await self.disconnect(websocket)
 
-    def _enqueue_payload(
+    def _enqueue_message(
         self,
         state: _ConnectionState,
-        payload: dict[str, Any],
+        message: str,
     ) -> None:
         try:
-            state.queue.put_nowait(payload)
+            state.queue.put_nowait(message)
             return
         except asyncio.QueueFull:
             pass
@@ -184,20 +182,23 @@ class ExecutionEventEmitter:
             return
 
         try:
-            state.queue.put_nowait(payload)
+            state.queue.put_nowait(message)
         except asyncio.QueueFull:
             state.dropped_events += 1
 
     async def emit(self, event: ExecutionEvent) -> None:
-        payload = event.model_dump(mode="json")
         async with self._lock:
             targets = [
                 state
                 for state in self._connections.values()
                 if state.subscription.matches(event)
             ]
+        if not targets:
+            return
+        # Serialize once and fan the same text frame out to every subscriber.
+        message = event.model_dump_json()
         for state in targets:
-            self._enqueue_payload(state, payload)
+            self._enqueue_message(state, message)
 
     async def dropped_event_count(self) -> int:
         async with self._lock:
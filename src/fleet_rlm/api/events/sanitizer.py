@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
+from itertools import islice
 from typing import Any
 
 from fleet_rlm.runtime.content.execution_limits import (
@@ -78,13 +79,13 @@ def _sanitize_event_payload(value: Any, *, depth: int, limits: _SanitizeLimits)
         return _truncate_text(value, max_chars=limits.max_text_chars)
     if isinstance(value, bytes):
         return f"<bytes:{len(value)}>"
+    # Collections are walked lazily so a huge payload only costs the items kept.
     if isinstance(value, dict):
-        items = list(value.items())
         sanitized: dict[str, Any] = {}
         max_items = limits.max_collection_items
-        for index, (key, raw) in enumerate(items):
+        for index, (key, raw) in enumerate(value.items()):
             if index >= max_items:
-                sanitized["__truncated__"] = len(items) - max_items
+                sanitized["__truncated__"] = len(value) - max_items
                 break
             key_str = str(key)
             if _looks_sensitive_key(key_str):
@@ -95,14 +96,13 @@ def _sanitize_event_payload(value: Any, *, depth: int, limits: _SanitizeLimits)
                 )
         return sanitized
     if isinstance(value, (list, tuple, set)):
-        sequence = list(value)
         max_items = limits.max_collection_items
         limited = [
             _sanitize_event_payload(item, depth=depth + 1, limits=limits)
-            for item in sequence[:max_items]
+            for item in islice(value, max_items)
         ]
-        if len(sequence) > max_items:
-            limited.append(f"<truncated:{len(sequence) - max_items}>")
+        if len(value) > max_items:
+            limited.append(f"<truncated:{len(value) - max_items}>")
         return limited
     return _truncate_text(str(value), max_chars=limits.max_text_chars)
 
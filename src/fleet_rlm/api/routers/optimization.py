@@ -1609,6 +1609,13 @@ def _parse_rows(content: bytes, fmt: str) -> list[Any]:
         raise ValueError("JSON file must contain a top-level array of objects")
 
 
+def _read_file_bytes(path: Path) -> bytes | None:
+    """Return the bytes at *path*, or ``None`` when it is not a regular file."""
+    if not path.is_file():
+        return None
+    return path.read_bytes()
+
+
 def _require_object_rows(rows: list[Any]) -> list[dict[str, Any]]:
     """Ensure every dataset row is a JSON object before persistence."""
     object_rows: list[dict[str, Any]] = []
@@ -1883,14 +1890,13 @@ async def get_dataset_detail(
     # Read sample rows from the file
     sample_rows: list[dict] = []
     uri_path = Path(ds.uri)
-    if await asyncio.to_thread(uri_path.is_file):
-        try:
+    try:
+        raw = await asyncio.to_thread(_read_file_bytes, uri_path)
+        if raw is not None:
             fmt = ds.format or ("jsonl" if uri_path.suffix == ".jsonl" else "json")
-            raw = await asyncio.to_thread(uri_path.read_bytes)
-            all_rows = _parse_rows(raw, fmt)
-            sample_rows = all_rows[:10]
-        except Exception:
-            logger.debug("Failed to read sample rows from %s", ds.uri)
+            sample_rows = _parse_rows(raw, fmt)[:10]
+    except Exception:
+        logger.debug("Failed to read sample rows from %s", ds.uri)
 
     return DatasetDetailResponse(
         id=str(ds.id or 0),
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any
 
@@ -12,6 +13,10 @@ from ...dependencies import ServerState, build_unauthenticated_identity
 
 logger = logging.getLogger(__name__)
 
+# Same output as ``WebSocket.send_json``, whose ``json.dumps`` call builds a
+# fresh encoder for its non-default options on every message.
+_encode_ws_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
 _WEBSOCKET_CLOSED_ERROR_FRAGMENTS = (
     "after sending 'websocket.close'",
     "response already completed",
@@ -34,8 +39,9 @@ def _is_closed_websocket_runtime_error(exc: RuntimeError) -> bool:
 
 async def _try_send_json(websocket: WebSocket, payload: Any) -> bool:
     """Send JSON when possible, returning False if the websocket already closed."""
+    text = _encode_ws_json(payload)
     try:
-        await websocket.send_json(payload)
+        await websocket.send_text(text)
         return True
     except WebSocketDisconnect:
         return False
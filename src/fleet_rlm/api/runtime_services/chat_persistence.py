@@ -188,43 +188,69 @@ class ExecutionLifecycleManager:
                     break
                 batch.append(extra)
 
+            requests: list[RunStepCreateRequest] = []
             for batch_step in batch:
                 self._step_index += 1
-                try:
-                    persisted = await self.repository.append_step(
-                        RunStepCreateRequest(
-                            tenant_id=self.identity_rows.tenant_id,
-                            run_id=self.active_run_db_id,
-                            step_index=self._step_index,
-                            step_type=_map_execution_step_type(batch_step.type),
-                            input_json=batch_step.input
-                            if isinstance(batch_step.input, dict)
-                            else {"value": batch_step.input}
-                            if batch_step.input is not None
-                            else None,
-                            output_json=batch_step.output
-                            if isinstance(batch_step.output, dict)
-                            else {"value": batch_step.output}
-                            if batch_step.output is not None
-                            else None,
-                        )
-                    )
-                    self._last_step_db_id = persisted.id
-                    if self._session_record is not None:
-                        self._session_record["last_step_db_id"] = str(persisted.id)
-                except Exception as exc:
-                    self._persistence_error = exc
-                    logger.warning(
-                        "Failed to persist run step: %s",
-                        _sanitize_for_log(exc),
+                requests.append(
+                    RunStepCreateRequest(
+                        tenant_id=self.identity_rows.tenant_id,
+                        run_id=self.active_run_db_id,
+                        step_index=self._step_index,
+                        step_type=_map_execution_step_type(batch_step.type),
+                        input_json=batch_step.input
+                        if isinstance(batch_step.input, dict)
+                        else {"value": batch_step.input}
+                        if batch_step.input is not None
+                        else None,
+                        output_json=batch_step.output
+                        if isinstance(batch_step.output, dict)
+                        else {"value": batch_step.output}
+                        if batch_step.output is not None
+                        else None,
                     )
-                    if self.strict_persistence:
-                        break
+                )
+
+            # One transaction per coalesced batch instead of one per step.
+            try:
+                persisted_steps = await self.repository.append_steps(requests)
+            except Exception as exc:
+                if len(requests) == 1:
+                    self._record_step_persistence_error(exc)
+                    persisted_steps = []
+                else:
+                    # The batch rolled back as a whole; replay it one step per
+                    # transaction so a single bad step only loses itself.
+                    persisted_steps = await self._append_steps_individually(requests)
+            if persisted_steps:
+                self._last_step_db_id = persisted_steps[-1].id
+                if self._session_record is not None:
+                    self._session_record["last_step_db_id"] = str(self._last_step_db_id)
             if self.strict_persistence and self._persistence_error is not None:
                 break
             if shutdown_requested:
                 break
 
+    def _record_step_persistence_error(self, exc: Exception) -> None:
+        self._persistence_error = exc
+        logger.warning(
+            "Failed to persist run steps: %s",
+            _sanitize_for_log(exc),
+        )
+
+    async def _append_steps_individually(
+        self, requests: list[RunStepCreateRequest]
+    ) -> list[Any]:
+        assert self.repository is not None
+        persisted: list[Any] = []
+        for request in requests:
+            try:
+                persisted.append(await self.repository.append_step(request))
+            except Exception as exc:
+                self._record_step_persistence_error(exc)
+                if self.strict_persistence:
+                    break
+        return persisted
+
     async def _ensure_persist_worker(self) -> None:
         if not self._can_persist:
             return
@@ -10,6 +10,9 @@ from fleet_rlm.runtime.quality.transcript_exports import (
     build_transcript_dataset_rows as _build_transcript_dataset_rows,
 )
 
+# ``json.dumps`` builds a fresh encoder whenever non-default options are passed.
+_encode_jsonl_row = json.JSONEncoder(ensure_ascii=False).encode
+
 
 def build_transcript_dataset_rows(
     *,
@@ -38,6 +41,5 @@ def persist_jsonl_rows(
         suffix=".jsonl",
         delete=False,
     ) as fh:
-        for row in rows:
-            fh.write(json.dumps(row, ensure_ascii=False) + "\n")
+        fh.writelines(_encode_jsonl_row(row) + "\n" for row in rows)
         return Path(fh.name).resolve()
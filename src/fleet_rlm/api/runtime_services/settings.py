@@ -152,13 +152,19 @@ async def apply_runtime_settings_patch(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    runtime_snapshot = _capture_runtime_config_snapshot(state=state)
-    env_text = (
-        config.env_path.read_text(encoding="utf-8")
-        if config.env_path.exists()
-        else None
-    )
-    env_snapshot = {key: os.environ.get(key) for key in RUNTIME_SETTINGS_KEYS}
+    # Rollback state is only needed when a model reload can fail; plain
+    # setting updates skip the extra .env read and snapshots.
+    runtime_snapshot: RuntimeConfigSnapshot | None = None
+    env_text: str | None = None
+    env_snapshot: dict[str, str | None] = {}
+    if any(key in RUNTIME_MODEL_RELOAD_KEYS for key in normalized):
+        runtime_snapshot = _capture_runtime_config_snapshot(state=state)
+        env_text = (
+            config.env_path.read_text(encoding="utf-8")
+            if config.env_path.exists()
+            else None
+        )
+        env_snapshot = {key: os.environ.get(key) for key in RUNTIME_SETTINGS_KEYS}
     result = apply_env_updates(updates=normalized, env_path=config.env_path)
     applied_updates = {
         key: normalized[key] for key in result["updated"] if key in normalized
@@ -191,12 +197,13 @@ async def apply_runtime_settings_patch(
             default_max_tokens=trial_config.agent_delegate_max_tokens,
         )
     except Exception:
-        _restore_runtime_settings_env(
-            env_path=config.env_path,
-            env_text=env_text,
-            env_snapshot=env_snapshot,
-        )
-        _restore_runtime_config_snapshot(state=state, snapshot=runtime_snapshot)
+        if runtime_snapshot is not None:
+            _restore_runtime_settings_env(
+                env_path=config.env_path,
+                env_text=env_text,
+                env_snapshot=env_snapshot,
+            )
+            _restore_runtime_config_snapshot(state=state, snapshot=runtime_snapshot)
         schedule_optional_runtime_startup(state)
         raise
 
@@ -6,14 +6,29 @@ CLI entrypoint.
 
 from __future__ import annotations
 
+import sys
+from functools import lru_cache
 from importlib.util import find_spec
 
 import typer
 
-from fleet_rlm.api.config import ServerRuntimeConfig
-
 from ..config import require_current_app_config
 
+_SERVER_REQUIREMENTS = ("fastapi", "uvicorn")
+_MCP_REQUIREMENTS = ("fastmcp",)
+
+
+@lru_cache(maxsize=4)
+def _missing_packages(packages: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the packages in *packages* that cannot be imported.
+
+    Already-imported modules skip the ``find_spec`` path scan, and the
+    result is cached because installed packages do not change mid-run.
+    """
+    return tuple(
+        pkg for pkg in packages if pkg not in sys.modules and find_spec(pkg) is None
+    )
+
 
 def serve_api_command(
     host: str = typer.Option("127.0.0.1", help="Bind host"),
@@ -21,7 +36,7 @@ def serve_api_command(
 ) -> None:
     """Run the FastAPI server surface (used by `fleet web`)."""
     config = require_current_app_config()
-    missing = [pkg for pkg in ("fastapi", "uvicorn") if find_spec(pkg) is None]
+    missing = _missing_packages(_SERVER_REQUIREMENTS)
     if missing:
         typer.echo(
             "Server dependencies missing: "
@@ -34,6 +49,7 @@ def serve_api_command(
 
     import uvicorn
 
+    from fleet_rlm.api.config import ServerRuntimeConfig
     from fleet_rlm.api.main import create_app
 
     app_obj = create_app(config=ServerRuntimeConfig.from_app_config(config))
@@ -50,7 +66,7 @@ def serve_mcp_command(
 ) -> None:
     """Run optional FastMCP server surface (requires `--extra mcp`)."""
     config = require_current_app_config()
-    missing = [pkg for pkg in ("fastmcp",) if find_spec(pkg) is None]
+    missing = _missing_packages(_MCP_REQUIREMENTS)
     if missing:
         typer.echo(
             "MCP dependencies missing: "
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import uuid
-from contextlib import nullcontext
+from collections.abc import Coroutine, Iterator
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
@@ -23,7 +24,7 @@ from fleet_rlm.runtime.config import (
     get_planner_lm_from_env,
 )
 from fleet_rlm.runtime.factory import build_chat_agent
-from fleet_rlm.runtime.models import TraceMode
+from fleet_rlm.runtime.models import TraceMode, TurnState
 from fleet_rlm.integrations.config.env import AppConfig
 
 from .commands import _normalize_trace_mode, handle_slash_command
@@ -49,6 +50,8 @@ from .session_view import (
 )
 from .ui import _FleetCompleter, _history_path, _prompt_label
 
+_T = TypeVar("_T")
+
 
 @dataclass(slots=True)
 class TerminalChatOptions:
@@ -139,6 +142,9 @@ class _TerminalChatSession:
         self.is_processing = False
         self.transcript: list[tuple[str, str]] = []
         self.command_permissions: dict[str, str] = {}
+        # One event loop serves every turn and command in the session, so
+        # async clients stay bound to a live loop between prompts.
+        self._loop: asyncio.AbstractEventLoop | None = None
 
         history_path = _history_path()
         history_path.parent.mkdir(parents=True, exist_ok=True)
@@ -192,7 +198,7 @@ class _TerminalChatSession:
 
         lm_context = build_dspy_context(lm=planner_lm) if planner_lm else nullcontext()
         screen_ctx = self.console.screen(hide_cursor=False)
-        with screen_ctx, lm_context, agent_context as agent:
+        with screen_ctx, lm_context, agent_context as agent, self._session_loop():
             while True:
                 self._render_shell()
                 try:
@@ -223,16 +229,51 @@ class _TerminalChatSession:
                     continue
 
                 try:
-                    asyncio.run(self._run_chat_turn(agent, line))
+                    self._run_async(self._run_chat_turn(agent, line))
                 except KeyboardInterrupt:
                     self._print_warning("Turn cancelled by user.")
                 except Exception as exc:  # pragma: no cover - runtime path
                     self._print_error(str(exc))
 
+    def _run_async(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run *coro* to completion on the session event loop."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            loop = self._loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            # Like ``asyncio.run``: nothing from this turn outlives it, so an
+            # interrupted turn cannot resume during the next one.
+            pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
+
+    @contextmanager
+    def _session_loop(self) -> Iterator[None]:
+        """Close the session event loop when the prompt loop exits."""
+        try:
+            yield
+        finally:
+            loop, self._loop = self._loop, None
+            if loop is not None and not loop.is_closed():
+                try:
+                    loop.run_until_complete(loop.shutdown_asyncgens())
+                    loop.run_until_complete(loop.shutdown_default_executor())
+                finally:
+                    loop.close()
+
     async def _run_chat_turn(self, agent: Any, message: str) -> None:
         """Run a single chat turn with streaming output."""
-        trace_enabled = self.trace_mode != "off"
-        assistant_chunks: list[str] = []
+        # Reasoning steps are only shown in verbose mode; don't stream them
+        # (an extra next_thought listener) when they would be dropped here.
+        stream_reasoning = self.trace_mode == "verbose"
+        # TurnState joins tokens lazily, so each redraw only joins new tokens.
+        turn_state = TurnState()
         tool_calls: list[str] = []
         final_text = ""
         final_payload: dict[str, Any] = {}
@@ -241,21 +282,53 @@ class _TerminalChatSession:
         self.last_status = "thinking..."
         self._render_shell()
         token_since_render = 0
+        # Streamed reasoning arrives as token-sized chunks; a run of them is
+        # kept as one "thinking" entry and redrawn at the token cadence.
+        thinking_chunks: list[str] = []
+        thinking_open = False
+
+        def _flush_thinking() -> None:
+            nonlocal thinking_open
+            content = "".join(thinking_chunks).strip()
+            if not content:
+                return
+            if thinking_open:
+                self.transcript[-1] = ("thinking", content)
+            else:
+                self._append_transcript("thinking", content)
+                thinking_open = True
 
         try:
             async for event in agent.aiter_chat_turn_stream(
                 message=message,
-                trace=trace_enabled,
+                trace=stream_reasoning,
             ):
                 kind = event.kind
                 text = event.text or ""
                 stripped = text.strip()
 
+                if kind == "reasoning_step":
+                    if self.trace_mode == "verbose" and text:
+                        thinking_chunks.append(text)
+                        token_since_render += 1
+                        if token_since_render >= 24:
+                            _flush_thinking()
+                            self._render_shell(
+                                draft_assistant=turn_state.transcript_text
+                            )
+                            token_since_render = 0
+                    continue
+
+                if thinking_chunks:
+                    _flush_thinking()
+                    thinking_chunks.clear()
+                    thinking_open = False
+
                 if kind == "assistant_token":
-                    assistant_chunks.append(text)
+                    turn_state.apply(event)
                     token_since_render += 1
                     if token_since_render >= 24:
-                        self._render_shell(draft_assistant="".join(assistant_chunks))
+                        self._render_shell(draft_assistant=turn_state.transcript_text)
                         token_since_render = 0
                     continue
 
@@ -263,7 +336,7 @@ class _TerminalChatSession:
                     self.last_status = stripped
                     if self.trace_mode == "verbose":
                         self._append_transcript("status", stripped)
-                        self._render_shell(draft_assistant="".join(assistant_chunks))
+                        self._render_shell(draft_assistant=turn_state.transcript_text)
                     continue
 
                 if kind == "tool_call" and stripped:
@@ -271,21 +344,12 @@ class _TerminalChatSession:
                     self.last_status = stripped
                     if self.trace_mode != "off":
                         self._append_transcript("tool", f"-> {stripped}")
-                        self._render_shell(draft_assistant="".join(assistant_chunks))
+                        self._render_shell(draft_assistant=turn_state.transcript_text)
                     continue
 
                 if kind == "tool_result" and stripped and self.trace_mode == "verbose":
                     self._append_transcript("tool", f"* {stripped}")
-                    self._render_shell(draft_assistant="".join(assistant_chunks))
-                    continue
-
-                if (
-                    kind == "reasoning_step"
-                    and stripped
-                    and self.trace_mode == "verbose"
-                ):
-                    self._append_transcript("thinking", stripped)
-                    self._render_shell(draft_assistant="".join(assistant_chunks))
+                    self._render_shell(draft_assistant=turn_state.transcript_text)
                     continue
 
                 if kind == "final":
@@ -304,9 +368,11 @@ class _TerminalChatSession:
                 if kind == "error":
                     raise RuntimeError(stripped or "streaming error")
         finally:
+            if thinking_chunks:
+                _flush_thinking()
             self.is_processing = False
 
-        assistant_response = final_text or "".join(assistant_chunks).strip()
+        assistant_response = final_text or turn_state.transcript_text.strip()
         if not assistant_response:
             assistant_response = "[no response]"
         if self.trace_mode == "compact" and tool_calls:
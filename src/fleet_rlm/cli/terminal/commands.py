@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 import shlex
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -118,53 +119,104 @@ def _run_session_action(
     arg_text: str,
     trace_modes: set[str],
 ) -> bool:
-    if action == "palette":
-        return print_command_palette(session, agent)
-    if action == "shortcuts":
-        _show_shortcuts(session)
-        return False
-    if action == "exit":
-        session.console.print("[dim]bye[/dim]")
-        return True
-    if action == "clear":
-        session.console.clear()
-        session._print_banner(planner_ready=True)
-        return False
-    if action == "reset":
-        if not _confirm("Reset agent history and clear sandbox buffers?"):
-            session._print_warning("Reset cancelled.")
-            return False
-        result = agent.reset(clear_sandbox_buffers=True)
-        session._print_result(result, title="reset")
-        return False
-    if action == "trace":
-        mode = arg_text.strip().lower()
-        if mode not in trace_modes:
-            session._print_error("usage: /trace <compact|verbose|off>")
-            return False
-        session.trace_mode = _normalize_trace_mode(mode)
-        session.console.print(f"[green]Trace mode set to {session.trace_mode}[/]")
-        return False
-    if action == "status":
-        session._print_status(agent)
-        return False
-    if action == "settings":
-        session._run_settings(arg_text.strip().lower())
-        return False
-    if action == "model":
-        session._run_settings("model")
-        return False
-    if action == "permissions":
-        session._print_permissions()
-        return False
-    if action == "permissions-reset":
-        session.command_permissions.clear()
-        session._print_warning("Permission policy reset.")
+    handler = _SESSION_ACTION_HANDLERS.get(action)
+    if handler is None:
+        raise ValueError(f"Unknown session action: {action}")
+    return handler(session, agent, arg_text, trace_modes)
+
+
+def _action_palette(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    return print_command_palette(session, agent)
+
+
+def _action_shortcuts(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    _show_shortcuts(session)
+    return False
+
+
+def _action_exit(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    session.console.print("[dim]bye[/dim]")
+    return True
+
+
+def _action_clear(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    session.console.clear()
+    session._print_banner(planner_ready=True)
+    return False
+
+
+def _action_reset(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    if not _confirm("Reset agent history and clear sandbox buffers?"):
+        session._print_warning("Reset cancelled.")
         return False
-    if action == "run-long-context":
-        session._run_long_context(arg_text)
+    result = agent.reset(clear_sandbox_buffers=True)
+    session._print_result(result, title="reset")
+    return False
+
+
+def _action_trace(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    mode = arg_text.strip().lower()
+    if mode not in trace_modes:
+        session._print_error("usage: /trace <compact|verbose|off>")
         return False
-    raise ValueError(f"Unknown session action: {action}")
+    session.trace_mode = _normalize_trace_mode(mode)
+    session.console.print(f"[green]Trace mode set to {session.trace_mode}[/]")
+    return False
+
+
+def _action_status(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    session._print_status(agent)
+    return False
+
+
+def _action_settings(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    session._run_settings(arg_text.strip().lower())
+    return False
+
+
+def _action_model(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    session._run_settings("model")
+    return False
+
+
+def _action_permissions(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    session._print_permissions()
+    return False
+
+
+def _action_permissions_reset(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    session.command_permissions.clear()
+    session._print_warning("Permission policy reset.")
+    return False
+
+
+def _action_run_long_context(
+    session: Any, agent: Any, arg_text: str, trace_modes: set[str]
+) -> bool:
+    session._run_long_context(arg_text)
+    return False
 
 
 def _make_required_text_payload_builder(
@@ -273,6 +325,24 @@ _SESSION_COMMAND_ACTIONS: dict[str, str] = {
 }
 
 
+_SessionActionHandler = Callable[[Any, Any, str, set[str]], bool]
+
+_SESSION_ACTION_HANDLERS: dict[str, _SessionActionHandler] = {
+    "palette": _action_palette,
+    "shortcuts": _action_shortcuts,
+    "exit": _action_exit,
+    "clear": _action_clear,
+    "reset": _action_reset,
+    "trace": _action_trace,
+    "status": _action_status,
+    "settings": _action_settings,
+    "model": _action_model,
+    "permissions": _action_permissions,
+    "permissions-reset": _action_permissions_reset,
+    "run-long-context": _action_run_long_context,
+}
+
+
 _ALIAS_COMMAND_SPECS: dict[str, _AliasCommandSpec] = {
     "/docs": _AliasCommandSpec(
         "load_document",
@@ -427,7 +497,8 @@ def _execute_agent_command(
         return
 
     try:
-        result = asyncio.run(agent.execute_command(command, args))
+        run_async = getattr(session, "_run_async", None) or asyncio.run
+        result = run_async(agent.execute_command(command, args))
         session._print_result(result, title=command)
     except Exception as exc:  # pragma: no cover - runtime path
         session._print_error(str(exc))
@@ -573,6 +644,9 @@ def _split_slash_command(line: str) -> tuple[str, str]:
     return command, arg_text
 
 
+_SHLEX_WHITESPACE = re.compile(r"[ \t\r\n]+")
+
+
 def _safe_split(arg_text: str) -> list[str]:
     """Safely split an argument string.
 
@@ -582,6 +656,10 @@ def _safe_split(arg_text: str) -> list[str]:
     Returns:
         List of split arguments.
     """
+    if not any(ch in arg_text for ch in "\"'\\"):
+        # Without quotes or escapes the POSIX lexer only splits on its own
+        # whitespace set, which excludes Unicode spaces that str.split uses.
+        return [part for part in _SHLEX_WHITESPACE.split(arg_text) if part]
     try:
         return shlex.split(arg_text)
     except ValueError:
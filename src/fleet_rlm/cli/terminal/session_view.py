@@ -49,14 +49,21 @@ def print_error(session: Any, message: str) -> None:
     render_shell(session)
 
 
+_TRANSCRIPT_LIMIT = 200
+# Entries allowed past the limit before trimming, so a full buffer is cut
+# back once per batch of appends rather than copied on every append.
+_TRANSCRIPT_SLACK = 50
+
+
 def append_transcript(session: Any, role: str, content: str) -> None:
     """Append a message to the transcript buffer."""
     text = content.strip()
     if not text:
         return
-    session.transcript.append((role, text))
-    if len(session.transcript) > 200:
-        session.transcript = session.transcript[-200:]
+    transcript = session.transcript
+    transcript.append((role, text))
+    if len(transcript) > _TRANSCRIPT_LIMIT + _TRANSCRIPT_SLACK:
+        del transcript[:-_TRANSCRIPT_LIMIT]
 
 
 def render_shell(session: Any, *, draft_assistant: str = "") -> None:
@@ -310,6 +310,63 @@ def _dialog_style() -> Style:
     )
 
 
+# Rows taken by the header/footer panels and the transcript panel border,
+# and columns taken by the panel border and padding.
+_SHELL_CHROME_ROWS = 8
+_SHELL_PANEL_PADDING = 4
+_TRANSCRIPT_WINDOW = 30
+# The footer never changes between redraws, so it is built once.
+_SHELL_FOOTER = Panel(
+    Text(
+        "Enter=send • Shift+Enter=newline • /=command palette • "
+        "Ctrl+C=interrupt • /help=commands",
+        style="dim",
+    ),
+    border_style="bright_black",
+)
+
+
+def _wrapped_rows(text: str, *, width: int) -> int:
+    """Return how many terminal rows ``text`` occupies when wrapped."""
+    return sum(max(1, -(-len(line) // width)) for line in text.split("\n"))
+
+
+def _tail_rows(text: str, *, width: int, rows: int) -> str:
+    """Return the trailing lines of ``text`` that fit in ``rows`` rows."""
+    kept: list[str] = []
+    for line in reversed(text.split("\n")):
+        rows -= max(1, -(-len(line) // width))
+        if rows < 0:
+            break
+        kept.append(line)
+    return "\n".join(reversed(kept))
+
+
+def _visible_transcript(
+    transcript: list[tuple[str, str]], *, width: int, rows: int
+) -> list[tuple[str, str]]:
+    """Return the newest transcript entries that fit in the visible rows.
+
+    Entries are walked newest-first and rendering stops once the viewport
+    is full, so a long transcript or a large result only costs the rows
+    that are actually shown. The oldest visible entry keeps its tail.
+    """
+    visible: list[tuple[str, str]] = []
+    for role, content in reversed(transcript[-_TRANSCRIPT_WINDOW:]):
+        if rows <= 0:
+            break
+        # One extra row for the blank separator line after each entry.
+        needed = _wrapped_rows(f"{role}> {content}", width=width) + 1
+        if needed > rows:
+            content = _tail_rows(content, width=width, rows=rows - 1)
+            if not content:
+                break
+        visible.append((role, content))
+        rows -= needed
+    visible.reverse()
+    return visible
+
+
 def _render_shell(
     *,
     console: Any,
@@ -334,53 +391,51 @@ def _render_shell(
         draft_assistant: Draft assistant response text.
     """
     header = Panel(
-        Text.from_markup(
-            f"[bold]fleet[/]  "
-            f"[dim]session[/]={session_id}  "
-            f"[dim]model[/]={model}  "
-            f"[dim]trace[/]={trace_mode}  "
-            f"[dim]status[/]={last_status}"
+        Text.assemble(
+            ("fleet", "bold"),
+            "  ",
+            ("session", "dim"),
+            f"={session_id}  ",
+            ("model", "dim"),
+            f"={model}  ",
+            ("trace", "dim"),
+            f"={trace_mode}  ",
+            ("status", "dim"),
+            f"={last_status}",
         ),
         border_style="cyan",
         padding=(0, 1),
     )
 
+    # ``console.size`` re-queries the terminal on every access; read it once.
+    size = console.size
+    width = max(size.width - _SHELL_PANEL_PADDING, 1)
+    rows = max(size.height - _SHELL_CHROME_ROWS, 1)
+    draft = ""
+    if is_processing and draft_assistant:
+        draft = _tail_rows(draft_assistant, width=width, rows=rows)
+        rows -= _wrapped_rows(f"assistant> {draft}", width=width)
+
     body_text = Text()
-    for role, content in transcript[-30:]:
-        role_style = {
-            "you": "bold white",
-            "assistant": "bold cyan",
-            "status": "dim",
-            "tool": "magenta",
-            "thinking": "dim",
-            "warning": "yellow",
-            "error": "red",
-            "result": "blue",
-        }.get(role, "white")
-        body_text.append(f"{role}> ", style=role_style)
+    for role, content in _visible_transcript(transcript, width=width, rows=rows):
+        body_text.append(f"{role}> ", style=ROLE_STYLES.get(role, "white"))
         body_text.append(content + "\n\n")
 
-    if is_processing and draft_assistant:
+    if draft:
         body_text.append("assistant> ", style="bold cyan")
-        body_text.append(draft_assistant + "\n")
+        body_text.append(draft + "\n")
 
     transcript_panel = Panel(
-        body_text if body_text.plain.strip() else Text("No messages yet.", style="dim"),
+        body_text if body_text else Text("No messages yet.", style="dim"),
         border_style="bright_black",
         title="chat",
     )
 
-    hint = (
-        "Enter=send • Shift+Enter=newline • /=command palette • "
-        "Ctrl+C=interrupt • /help=commands"
-    )
-    footer = Panel(Text(hint, style="dim"), border_style="bright_black")
-
     layout = Layout()
     layout.split_column(
         Layout(header, size=3),
         Layout(transcript_panel, ratio=1),
-        Layout(footer, size=3),
+        Layout(_SHELL_FOOTER, size=3),
     )
 
     console.clear()
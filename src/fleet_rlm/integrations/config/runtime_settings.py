@@ -96,13 +96,31 @@ def resolve_env_path(*, start_paths: Sequence[Path] | None = None) -> Path:
     return fallback_root / ".env"
 
 
+# Parsed .env files keyed by path, tagged with the (mtime_ns, size) they were
+# parsed at so external edits are picked up on the next read.
+_ENV_FILE_CACHE: dict[Path, tuple[int, int, dict[str, str]]] = {}
+
+
 def _read_env_file_values(path: Path) -> dict[str, str]:
     """Best-effort .env parser used for runtime snapshot precedence."""
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
+        _ENV_FILE_CACHE.pop(path, None)
         return {}
 
+    cached = _ENV_FILE_CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return dict(cached[2])
+
+    values = _parse_env_text(path.read_text(encoding="utf-8"))
+    _ENV_FILE_CACHE[path] = (stat.st_mtime_ns, stat.st_size, values)
+    return dict(values)
+
+
+def _parse_env_text(text: str) -> dict[str, str]:
     values: dict[str, str] = {}
-    for raw in path.read_text(encoding="utf-8").splitlines():
+    for raw in text.splitlines():
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -287,5 +305,6 @@ def apply_env_updates(
     for key, value in effective_updates.items():
         set_key(str(target), key, value)
         os.environ[key] = value
+    _ENV_FILE_CACHE.pop(target, None)
 
     return {"updated": sorted(effective_updates.keys()), "env_path": str(target)}
@@ -1247,57 +1247,89 @@ class FleetRepository(RepositoryContextMixin):
             return result.scalar_one_or_none()
 
     async def append_step(self, request: RunStepCreateRequest) -> RunStep:
-        step_type = (
-            request.step_type
-            if isinstance(request.step_type, RunStepType)
-            else RunStepType(request.step_type)
-        )
+        steps = await self.append_steps([request])
+        return steps[0]
+
+    async def append_steps(
+        self, requests: Sequence[RunStepCreateRequest]
+    ) -> list[RunStep]:
+        """Upsert a batch of run steps in a single transaction.
+
+        All requests must belong to the same tenant and workspace; the
+        workspace and request context are resolved once for the batch.
+        """
+        if not requests:
+            return []
+        first = requests[0]
+        if any(
+            request.tenant_id != first.tenant_id
+            or request.workspace_id != first.workspace_id
+            for request in requests
+        ):
+            raise ValueError(
+                "append_steps requires all requests to share one tenant and workspace"
+            )
         async with self._db.session() as session, session.begin():
             workspace_id = await self._resolve_workspace_id_in_session(
                 session,
-                tenant_id=request.tenant_id,
-                workspace_id=request.workspace_id,
+                tenant_id=first.tenant_id,
+                workspace_id=first.workspace_id,
             )
             await self._set_request_context(
-                session, request.tenant_id, workspace_id=workspace_id
+                session, first.tenant_id, workspace_id=workspace_id
             )
-            stmt = insert(RunStep).values(
-                tenant_id=request.tenant_id,
-                workspace_id=workspace_id,
-                run_id=request.run_id,
-                session_id=request.session_id,
-                turn_id=request.turn_id,
-                step_index=request.step_index,
-                step_type=step_type,
-                tool_name=request.tool_name,
-                input_json=request.input_json,
-                output_json=request.output_json,
-                cost_usd_micros=request.cost_usd_micros,
-                tokens_in=request.tokens_in,
-                tokens_out=request.tokens_out,
-                latency_ms=request.latency_ms,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=[
-                    RunStep.run_id,
-                    RunStep.step_index,
-                ],
-                set_={
-                    "step_type": step_type,
-                    "session_id": request.session_id,
-                    "turn_id": request.turn_id,
-                    "tool_name": request.tool_name,
-                    "input_json": request.input_json,
-                    "output_json": request.output_json,
-                    "cost_usd_micros": request.cost_usd_micros,
-                    "tokens_in": request.tokens_in,
-                    "tokens_out": request.tokens_out,
-                    "latency_ms": request.latency_ms,
-                    "updated_at": _utc_now(),
-                },
-            ).returning(RunStep)
-            result = await session.execute(stmt)
-            return result.scalar_one()
+            steps: list[RunStep] = []
+            for request in requests:
+                result = await session.execute(
+                    self._run_step_upsert(request, workspace_id=workspace_id)
+                )
+                steps.append(result.scalar_one())
+            return steps
+
+    @staticmethod
+    def _run_step_upsert(
+        request: RunStepCreateRequest, *, workspace_id: uuid.UUID
+    ) -> Any:
+        step_type = (
+            request.step_type
+            if isinstance(request.step_type, RunStepType)
+            else RunStepType(request.step_type)
+        )
+        stmt = insert(RunStep).values(
+            tenant_id=request.tenant_id,
+            workspace_id=workspace_id,
+            run_id=request.run_id,
+            session_id=request.session_id,
+            turn_id=request.turn_id,
+            step_index=request.step_index,
+            step_type=step_type,
+            tool_name=request.tool_name,
+            input_json=request.input_json,
+            output_json=request.output_json,
+            cost_usd_micros=request.cost_usd_micros,
+            tokens_in=request.tokens_in,
+            tokens_out=request.tokens_out,
+            latency_ms=request.latency_ms,
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=[
+                RunStep.run_id,
+                RunStep.step_index,
+            ],
+            set_={
+                "step_type": step_type,
+                "session_id": request.session_id,
+                "turn_id": request.turn_id,
+                "tool_name": request.tool_name,
+                "input_json": request.input_json,
+                "output_json": request.output_json,
+                "cost_usd_micros": request.cost_usd_micros,
+                "tokens_in": request.tokens_in,
+                "tokens_out": request.tokens_out,
+                "latency_ms": request.latency_ms,
+                "updated_at": _utc_now(),
+            },
+        ).returning(RunStep)
 
     async def store_artifact(self, request: ArtifactCreateRequest) -> Artifact:
         kind = (
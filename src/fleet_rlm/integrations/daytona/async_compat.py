@@ -90,15 +90,18 @@ class _AsyncCompatRunner:
         return future.result()
 
     def shutdown(self) -> None:
-        loop = self._loop
-        thread = self._thread
-        if loop is None or loop.is_closed() or thread is None:
-            return
+        # Detach the loop under the lock, then stop and join outside it so a
+        # concurrent ``_ensure_started`` never waits on the thread join.
+        with self._lock:
+            loop = self._loop
+            thread = self._thread
+            if loop is None or loop.is_closed() or thread is None:
+                return
+            self._loop = None
+            self._thread = None
+            self._thread_id = None
         loop.call_soon_threadsafe(loop.stop)
         thread.join(timeout=1)
-        self._loop = None
-        self._thread = None
-        self._thread_id = None
 
 
 _ASYNC_COMPAT_RUNNER = _AsyncCompatRunner()
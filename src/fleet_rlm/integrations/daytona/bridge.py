@@ -12,12 +12,11 @@ import json
 import keyword
 import os
 import time
-import urllib.error
-import urllib.request
 import uuid
 from dataclasses import dataclass
 from typing import Any, Callable
 
+import httpx
 from dspy.primitives import CodeInterpreterError
 
 from .async_compat import _await_if_needed, _run_async_compat
@@ -45,6 +44,7 @@ app = Flask(__name__)
 _lock = threading.Lock()
 _pending_requests: dict[str, dict[str, object]] = {}
 _results: dict[str, object] = {}
+_result_ready: dict[str, threading.Event] = {}
 
 
 @app.route("/health", methods=["GET"])
@@ -60,6 +60,7 @@ def tool_call():
     args = data.get("args", [])
     kwargs = data.get("kwargs", {})
 
+    ready = threading.Event()
     with _lock:
         _pending_requests[call_id] = {
             "tool_name": tool_name,
@@ -69,21 +70,16 @@ def tool_call():
             "claimed_at": None,
             "lease_token": None,
         }
+        _result_ready[call_id] = ready
 
-    timeout = __DAYTONA_TOOL_CALL_TIMEOUT_S__
-    interval = 0.05
-    elapsed = 0.0
-    while elapsed < timeout:
-        with _lock:
-            if call_id in _results:
-                result = _results.pop(call_id)
-                _pending_requests.pop(call_id, None)
-                return jsonify({"result": result})
-        time.sleep(interval)
-        elapsed += interval
-
+    # Block until post_result() hands the value over instead of polling.
+    delivered = ready.wait(__DAYTONA_TOOL_CALL_TIMEOUT_S__)
     with _lock:
+        _result_ready.pop(call_id, None)
         _pending_requests.pop(call_id, None)
+        if delivered and call_id in _results:
+            return jsonify({"result": _results.pop(call_id)})
+        _results.pop(call_id, None)
     return jsonify({"error": "Tool call timeout"}), 504
 
 
@@ -143,6 +139,9 @@ def post_result(call_id: str):
             return jsonify({"error": "Stale or invalid claim token"}), 409
         _results[call_id] = result
         req["lease_token"] = None
+        ready = _result_ready.get(call_id)
+    if ready is not None:
+        ready.set()
     return jsonify({"status": "ok"})
 
 
@@ -183,7 +182,7 @@ def {tool_name}({signature}):
         method="POST",
     )
     with _urllib_request.urlopen(req, timeout=130) as resp:
-        data = _json.loads(resp.read().decode("utf-8"))
+        data = _json.loads(resp.read())
     if "error" in data:
         raise RuntimeError(f"Tool call failed: {{data['error']}}")
     result = data.get("result")
@@ -314,6 +313,7 @@ class DaytonaToolBridge:
         self._broker_token: str | None = None
         self._broker_session_id: str | None = None
         self._injected_tools: set[str] = set()
+        self._http_client: httpx.Client | None = None
 
     def bind_context(self, context: Any) -> None:
         self.context = context
@@ -483,6 +483,7 @@ class DaytonaToolBridge:
         self._broker_token = None
         self._broker_session_id = None
         self._injected_tools.clear()
+        self._close_http_client()
         if not session_id:
             return
         try:
@@ -502,19 +503,40 @@ class DaytonaToolBridge:
             try:
                 if await asyncio.to_thread(self._check_health, broker_url):
                     return
-            except (urllib.error.URLError, urllib.error.HTTPError, OSError):
+            except (httpx.HTTPError, OSError):
                 await asyncio.sleep(0.1)
                 continue
         raise CodeInterpreterError("Broker server failed to start within timeout")
 
     def _check_health(self, broker_url: str) -> bool:
-        request = urllib.request.Request(
-            f"{broker_url}/health",
-            headers=self._preview_headers(),
-            method="GET",
-        )
-        with urllib.request.urlopen(request, timeout=5) as response:
-            return response.status == 200
+        response = self._client().get(f"{broker_url}/health")
+        response.raise_for_status()
+        return response.status_code == 200
+
+    def _client(self) -> httpx.Client:
+        """Return the keep-alive client shared by all broker requests.
+
+        Polling hits the broker's preview URL every few milliseconds; reusing
+        pooled connections avoids a TCP+TLS handshake per request.
+        """
+        client = self._http_client
+        if client is None:
+            client = httpx.Client(
+                timeout=5.0,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrent_tool_calls + 2,
+                    max_keepalive_connections=self.max_concurrent_tool_calls + 2,
+                ),
+            )
+            self._http_client = client
+        client.headers.update(self._preview_headers())
+        return client
+
+    def _close_http_client(self) -> None:
+        client = self._http_client
+        self._http_client = None
+        if client is not None:
+            client.close()
 
     def _preview_headers(self) -> dict[str, str]:
         token = self._broker_token
@@ -542,17 +564,18 @@ class DaytonaToolBridge:
         callback_count = 0
         inflight: dict[str, asyncio.Task[None]] = {}
 
+        client = self._client()
+
         def _fetch_pending(max_items: int) -> list[dict[str, Any]]:
-            request = urllib.request.Request(
-                (
-                    f"{broker_url}/pending?max={max_items}"
-                    f"&lease_seconds={self.tool_claim_lease_seconds}"
-                ),
-                headers=self._preview_headers(),
-                method="GET",
+            response = client.get(
+                f"{broker_url}/pending",
+                params={
+                    "max": max_items,
+                    "lease_seconds": self.tool_claim_lease_seconds,
+                },
             )
-            with urllib.request.urlopen(request, timeout=5) as response:
-                payload = json.loads(response.read().decode("utf-8"))
+            response.raise_for_status()
+            payload = json.loads(response.content)
             if isinstance(payload, dict) and isinstance(payload.get("requests"), list):
                 return [
                     item
@@ -562,21 +585,17 @@ class DaytonaToolBridge:
             return []
 
         def _post_result(call_id: str, result: Any, claim_token: str | None) -> None:
-            encoded_result = result if isinstance(result, str) else json.dumps(result)
-            payload = json.dumps(
-                {"result": encoded_result, "claim_token": claim_token}
-            ).encode("utf-8")
-            request = urllib.request.Request(
+            # Embed structured results directly so the sandbox wrapper decodes
+            # the reply once instead of unwrapping a JSON string inside JSON.
+            payload = json.dumps({"result": result, "claim_token": claim_token}).encode(
+                "utf-8"
+            )
+            response = client.post(
                 f"{broker_url}/result/{call_id}",
-                data=payload,
-                headers={
-                    **self._preview_headers(),
-                    "Content-Type": "application/json",
-                },
-                method="POST",
+                content=payload,
+                headers={"Content-Type": "application/json"},
             )
-            with urllib.request.urlopen(request, timeout=5):
-                return
+            response.raise_for_status()
 
         async def _execute_one(pending: dict[str, Any]) -> None:
             call_id = str(pending["id"])
@@ -598,8 +617,8 @@ class DaytonaToolBridge:
                 result = {"error": f"{type(exc).__name__}: {exc}"}
             try:
                 await asyncio.to_thread(_post_result, call_id, result, claim_token)
-            except urllib.error.HTTPError as exc:
-                if exc.code not in {404, 409}:
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code not in {404, 409}:
                     raise
 
         while not code_task.done() or inflight:
@@ -610,19 +629,24 @@ class DaytonaToolBridge:
                 await task
                 callback_count += 1
 
+            # Wait on local tool tasks directly instead of spinning on a timer;
+            # only the remote /pending fetch below still needs polling.
             if code_task.done():
                 if inflight:
-                    await asyncio.sleep(0.005)
+                    await asyncio.wait(inflight.values())
                 continue
 
             capacity = self.max_concurrent_tool_calls - len(inflight)
             if capacity <= 0:
-                await asyncio.sleep(0.01)
+                await asyncio.wait(
+                    [code_task, *inflight.values()],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
                 continue
 
             try:
                 pending_items = await asyncio.to_thread(_fetch_pending, capacity)
-            except (urllib.error.URLError, urllib.error.HTTPError, OSError):
+            except (httpx.HTTPError, OSError):
                 await asyncio.sleep(0.01)
                 continue
 
@@ -8,6 +8,7 @@ import logging
 import math
 import time
 from dataclasses import dataclass
+from itertools import islice
 from typing import AbstractSet, Any, Callable, Protocol, cast
 
 import dspy
@@ -62,6 +63,9 @@ from .runtime import (
 )
 from .types import SandboxSpec, dedupe_paths, normalized_context_sources
 
+# Values of these exact types always serialize, so they skip the json probe.
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 @dataclass(slots=True)
 class _DaytonaExecutionResponse:
@@ -100,6 +104,7 @@ class _DaytonaInterpreterLike(
     sandbox_spec: SandboxSpec | None
     sub_lm: Any
     llm_call_timeout: float
+    llm_batch_fail_fast: bool
     delete_session_on_shutdown: bool
     delete_context_on_shutdown: bool
     default_execution_profile: ExecutionProfile
@@ -123,6 +128,7 @@ class _DaytonaInterpreterLike(
     _setup_context_id: str | None
     _setup_workspace_path: str | None
     _submit_signature_key: tuple[tuple[str, str], ...] | None
+    _submit_signature_cache: tuple[tuple[str, str], ...] | None
     extract_final_artifact: Callable[..., dict[str, Any] | None]
 
     def inject_variables(self, code: str, variables: dict[str, Any]) -> str:
@@ -160,6 +166,7 @@ class _DaytonaInterpreterExecutionMixin(_DaytonaInterpreterLike):
             sub_lm=self.sub_lm,
             max_llm_calls=remaining_llm_budget,
             llm_call_timeout=self.llm_call_timeout,
+            llm_batch_fail_fast=self.llm_batch_fail_fast,
             default_execution_profile=ExecutionProfile.RLM_DELEGATE,
             async_execute=self.async_execute,
         )
@@ -278,6 +285,9 @@ class _DaytonaInterpreterExecutionMixin(_DaytonaInterpreterLike):
         safe_vars: dict[str, Any] = {}
         for key, value in (variables or {}).items():
             normalized_key = str(key)
+            if type(value) in _JSON_SCALAR_TYPES:
+                safe_vars[normalized_key] = value
+                continue
             try:
                 json.dumps(value)
                 safe_vars[normalized_key] = value
@@ -286,15 +296,18 @@ class _DaytonaInterpreterExecutionMixin(_DaytonaInterpreterLike):
         return safe_vars
 
     def submit_signature(self) -> tuple[tuple[str, str], ...] | None:
-        if not self.output_fields:
-            return None
+        # ``()`` caches "no typed signature"; ``None`` means not yet computed.
+        cached = self._submit_signature_cache
+        if cached is not None:
+            return cached or None
         normalized: list[tuple[str, str]] = []
-        for field in self.output_fields:
+        for field in self.output_fields or ():
             name = str(field.get("name") or "").strip()
             if not name:
                 continue
             normalized.append((name, str(field.get("type") or "").strip()))
-        return tuple(normalized) or None
+        self._submit_signature_cache = tuple(normalized)
+        return self._submit_signature_cache or None
 
     async def aensure_setup(
         self,
@@ -663,7 +676,7 @@ class _DaytonaInterpreterExecutionMixin(_DaytonaInterpreterLike):
 
         if final_payload is not None:
             output_keys = (
-                [str(key) for key in list(final_payload.keys())[:50]]
+                [str(key) for key in islice(final_payload, 50)]
                 if isinstance(final_payload, dict)
                 else None
             )
@@ -787,6 +800,7 @@ def _build_child_interpreter(
         sub_lm=interpreter.sub_lm,
         max_llm_calls=remaining_llm_budget,
         llm_call_timeout=interpreter.llm_call_timeout,
+        llm_batch_fail_fast=interpreter.llm_batch_fail_fast,
         default_execution_profile=ExecutionProfile.RLM_DELEGATE,
         async_execute=interpreter.async_execute,
     )
@@ -997,6 +1011,7 @@ class DaytonaInterpreter(
         sub_lm: dspy.LM | None = None,
         max_llm_calls: int = 50,
         llm_call_timeout: int = 60,
+        llm_batch_fail_fast: bool = True,
         default_execution_profile: ExecutionProfile = ExecutionProfile.RLM_DELEGATE,
         async_execute: bool = True,
     ) -> None:
@@ -1023,10 +1038,16 @@ class DaytonaInterpreter(
             sub_lm=sub_lm,
             max_llm_calls=max_llm_calls,
             llm_call_timeout=llm_call_timeout,
+            llm_batch_fail_fast=llm_batch_fail_fast,
         )
         initialize_sub_rlm_state(self)
-        self.output_fields: list[dict[str, Any]] | None
+        self._output_fields: list[dict[str, Any]] | None = None
+        self._submit_signature_cache: tuple[tuple[str, str], ...] | None = None
         self._tools: dict[str, Callable[..., Any]]
+        # dspy.RLM resets ``_tools_registered`` after ``tools.update(...)``; the
+        # cached bridge tool map is only reused while the flag stays set.
+        self._tools_registered = False
+        self._bridge_tools_cache: dict[str, Callable[..., Any]] | None = None
         self.execution_event_callback: Callable[[dict[str, Any]], None] | None
         initialize_tool_runtime_state(self)
         self._volume = None
@@ -1088,6 +1109,16 @@ class DaytonaInterpreter(
     @tools.setter
     def tools(self, value: dict[str, Callable[..., Any]]) -> None:
         set_registered_tools(self, value)
+        self._tools_registered = False
+
+    @property
+    def output_fields(self) -> list[dict[str, Any]] | None:
+        return self._output_fields
+
+    @output_fields.setter
+    def output_fields(self, value: list[dict[str, Any]] | None) -> None:
+        self._output_fields = value
+        self._submit_signature_cache = None
 
     def execution_profile(self, profile: ExecutionProfile):
         return execution_profile_context(self, profile)
@@ -1359,6 +1390,7 @@ class DaytonaInterpreter(
             return
         session = await self._aensure_session_impl()
         await session.astart_driver(timeout=float(self.execute_timeout or self.timeout))
+        self._start_sub_lm_executor()
         self._started = True
 
     def shutdown(self) -> None:
@@ -1369,6 +1401,7 @@ class DaytonaInterpreter(
             await self._adetach_session(delete=self.delete_session_on_shutdown)
         finally:
             self._started = False
+            self._shutdown_sub_lm_executor()
             await self._aclose_runtime()
 
     def _ensure_session_sync(self) -> DaytonaSandboxSession:
@@ -1733,7 +1766,13 @@ class DaytonaInterpreter(
         )
 
     def _bridge_tools(self) -> dict[str, Callable[..., Any]]:
-        return bridge_tools(self, native_tool_names=_DAYTONA_SANDBOX_NATIVE_TOOL_NAMES)
+        if self._tools_registered and self._bridge_tools_cache is not None:
+            return self._bridge_tools_cache
+        self._bridge_tools_cache = bridge_tools(
+            self, native_tool_names=_DAYTONA_SANDBOX_NATIVE_TOOL_NAMES
+        )
+        self._tools_registered = True
+        return self._bridge_tools_cache
 
     def _requires_bridge(self, code: str, tools: dict[str, Callable[..., Any]]) -> bool:
         return requires_bridge(self, code, tools)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 _FINAL_OUTPUT_MARKER = "__DSPY_FINAL_OUTPUT__"
@@ -17,6 +18,7 @@ _UNSUPPORTED_RECURSIVE_SANDBOX_CALLBACKS: tuple[str, ...] = (
 )
 
 
+@lru_cache(maxsize=1)
 def _generic_submit_code() -> str:
     return """
 def SUBMIT(**kwargs):
@@ -25,10 +27,15 @@ def SUBMIT(**kwargs):
 """.strip()
 
 
+# Rendered once per (workspace, volume) pair; the setup source is several
+# hundred lines and is re-sent whenever a sandbox context is (re)created.
+@lru_cache(maxsize=16)
 def _base_setup_code(*, workspace_path: str, volume_mount_path: str) -> str:
     return f"""
 import ast as _ast
+import collections as _collections
 import glob as _glob
+import itertools as _itertools
 import json as _json
 import os as _os
 import pathlib as _pathlib
@@ -36,6 +43,7 @@ import re as _re
 import subprocess as _subprocess
 import fcntl as _fcntl
 from contextlib import contextmanager as _contextmanager
+from functools import lru_cache as _lru_cache
 
 REPO_PATH = {workspace_path!r}
 MEMORY_ROOT = _pathlib.Path({volume_mount_path!r})
@@ -102,10 +110,14 @@ def peek(text: str, start: int = 0, length: int = 2000) -> str:
     window = max(0, int(length))
     return source[start_idx : start_idx + window]
 
+@_lru_cache(maxsize=64)
+def _compile_pattern(pattern: str):
+    return _re.compile(pattern)
+
 def grep(text: str, pattern: str, *, context: int = 0) -> list[str]:
     if not text:
         return []
-    compiled = _re.compile(pattern)
+    compiled = _compile_pattern(pattern)
     lines = str(text).splitlines()
     radius = max(0, int(context))
     results: list[str] = []
@@ -165,7 +177,12 @@ def read_process_logs(process_id: str, tail: int = 50) -> str:
     proc = pinfo["proc"]
     logs = pinfo["logs"]
     status = "RUNNING" if proc.poll() is None else f"EXITED({{proc.returncode}})"
-    lines = list(logs)[-tail:]
+    if tail > 0:
+        # Walk back from the newest entry instead of copying the whole buffer.
+        lines = list(_itertools.islice(reversed(logs), tail))
+        lines.reverse()
+    else:
+        lines = list(logs)[-tail:]
     return f"Status: {{status}}\\nLogs:\\n" + "".join(lines)
 
 def kill_process(process_id: str) -> str:
@@ -178,9 +195,13 @@ def kill_process(process_id: str) -> str:
     return f"Process {{process_id}} was already exited."
 
 
-def add_buffer(name: str, item: object) -> dict[str, object]:
+def add_buffer(name: str, item: object, *, maxlen: int | None = None) -> dict[str, object]:
+    # ``maxlen`` applies when the buffer is created; a full buffer drops its
+    # oldest entries.
     key = str(name or "").strip() or "default"
-    items = _buffers.setdefault(key, [])
+    items = _buffers.get(key)
+    if items is None:
+        items = _buffers[key] = _collections.deque(maxlen=maxlen)
     items.append(item)
     return {{"status": "ok", "name": key, "count": len(items)}}
 
@@ -269,6 +269,15 @@ class DaytonaSandboxSession:
         )
         return list(entries)
 
+    async def aget_file_info(self, path: str) -> Any:
+        await self._arebind_sandbox_if_needed()
+        return await _await_if_needed(
+            self.sandbox.fs.get_file_info(self._resolve_sandbox_path(path))
+        )
+
+    def get_file_info(self, path: str) -> Any:
+        return _run_async_compat(self.aget_file_info, path)
+
     async def adelete(self) -> None:
         await self.adelete_context()
         # Graceful stop before delete to let processes flush/clean up
@@ -318,12 +318,21 @@ async def aensure_relative_directory(
     *,
     base_path: PurePosixPath,
     relative_path: PurePosixPath,
+    created: set[PurePosixPath] | None = None,
 ) -> None:
-    """Create a relative directory tree under a mounted base path."""
+    """Create a relative directory tree under a mounted base path.
+
+    When *created* is given, directories already in it are skipped and new
+    ones are added, so sibling paths sharing a parent create it only once.
+    """
 
     current_path = base_path
     for part in relative_path.parts:
         current_path = current_path / part
+        if created is not None:
+            if current_path in created:
+                continue
+            created.add(current_path)
         try:
             await _await_if_needed(fs.create_folder(str(current_path), "755"))
         except Exception as exc:
@@ -362,11 +371,13 @@ async def areseed_wiki_subtree(
         base_path=memory_root,
         relative_path=PurePosixPath("wiki"),
     )
+    created: set[PurePosixPath] = set()
     for relative_directory in WIKI_DIRECTORIES:
         await aensure_relative_directory(
             fs,
             base_path=wiki_root,
             relative_path=relative_directory,
+            created=created,
         )
 
     rendered_files = render_wiki_templates(
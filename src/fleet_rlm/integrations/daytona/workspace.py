@@ -67,14 +67,30 @@ async def _abuild_workspace_path(sandbox: Any, repo_url: str | None) -> str:
     return str(PurePosixPath(work_dir) / "workspace" / workspace_name)
 
 
-async def _aensure_remote_directory(fs: Any, remote_path: PurePosixPath) -> None:
+async def _aensure_remote_directory(
+    fs: Any,
+    remote_path: PurePosixPath,
+    *,
+    ensured_dirs: set[str] | None = None,
+) -> None:
     directory = str(remote_path)
-    if directory and directory not in {".", "/"}:
-        await _await_if_needed(fs.create_folder(directory, _REMOTE_DIRECTORY_MODE))
+    if not directory or directory in {".", "/"}:
+        return
+    if ensured_dirs is not None:
+        # Sibling uploads share a parent; create it once per staging pass.
+        if directory in ensured_dirs:
+            return
+        ensured_dirs.add(directory)
+    await _await_if_needed(fs.create_folder(directory, _REMOTE_DIRECTORY_MODE))
 
 
-async def _aensure_remote_parent(fs: Any, remote_path: PurePosixPath) -> None:
-    await _aensure_remote_directory(fs, remote_path.parent)
+async def _aensure_remote_parent(
+    fs: Any,
+    remote_path: PurePosixPath,
+    *,
+    ensured_dirs: set[str] | None = None,
+) -> None:
+    await _aensure_remote_directory(fs, remote_path.parent, ensured_dirs=ensured_dirs)
 
 
 async def _aensure_workspace_root(*, sandbox: Any, workspace_path: str) -> None:
@@ -112,9 +128,13 @@ print(str(context_root))
 
 
 async def _aupload_remote_text(
-    fs: Any, remote_path: PurePosixPath, content: str
+    fs: Any,
+    remote_path: PurePosixPath,
+    content: str,
+    *,
+    ensured_dirs: set[str] | None = None,
 ) -> None:
-    await _aensure_remote_parent(fs, remote_path)
+    await _aensure_remote_parent(fs, remote_path, ensured_dirs=ensured_dirs)
     await _await_if_needed(fs.upload_file(content.encode("utf-8"), str(remote_path)))
 
 
@@ -137,6 +157,7 @@ async def _astage_local_file(
     resolved_path: Path,
     staged_root: PurePosixPath,
     source_id: str,
+    ensured_dirs: set[str] | None = None,
 ) -> ContextSource:
     text, metadata = await _aread_document_content(resolved_path)
     source_type = str(metadata.get("source_type") or "text")
@@ -144,7 +165,7 @@ async def _astage_local_file(
         source_path=resolved_path,
         source_type=source_type,
     )
-    await _aupload_remote_text(fs, staged_relative, text)
+    await _aupload_remote_text(fs, staged_relative, text, ensured_dirs=ensured_dirs)
     return ContextSource(
         source_id=source_id,
         kind="file",
@@ -162,12 +183,15 @@ async def _astage_local_directory(
     resolved_path: Path,
     staged_root: PurePosixPath,
     source_id: str,
+    ensured_dirs: set[str] | None = None,
 ) -> ContextSource:
     warnings: list[str] = []
     staged_count = 0
     skipped_count = 0
     extraction_methods: set[str] = set()
     source_types: set[str] = set()
+    if ensured_dirs is None:
+        ensured_dirs = set()
 
     for local_file in sorted(
         path for path in resolved_path.rglob("*") if path.is_file()
@@ -190,7 +214,7 @@ async def _astage_local_directory(
             source_type=source_type,
         )
         staged_relative = staged_root / relative_path.parent / destination_name
-        await _aupload_remote_text(fs, staged_relative, text)
+        await _aupload_remote_text(fs, staged_relative, text, ensured_dirs=ensured_dirs)
         staged_count += 1
 
     if staged_count == 0:
@@ -241,7 +265,10 @@ async def _astage_context_paths(
 
     fs = sandbox.fs
     context_root = PurePosixPath(workspace_path) / ".fleet-rlm" / "context"
-    await _aensure_remote_directory(fs, context_root)
+    # Directories created during this pass; the context root was just
+    # created, so later uploads (including the manifest) skip re-creating it.
+    ensured_dirs: set[str] = set()
+    await _aensure_remote_directory(fs, context_root, ensured_dirs=ensured_dirs)
     staged_sources: list[ContextSource] = []
 
     for index, raw_path in enumerate(raw_paths, start=1):
@@ -259,6 +286,7 @@ async def _astage_context_paths(
                         resolved_path=resolved,
                         staged_root=staged_root,
                         source_id=source_id,
+                        ensured_dirs=ensured_dirs,
                     )
                 )
             else:
@@ -268,6 +296,7 @@ async def _astage_context_paths(
                         resolved_path=resolved,
                         staged_root=staged_root,
                         source_id=source_id,
+                        ensured_dirs=ensured_dirs,
                     )
                 )
         except DaytonaDiagnosticError:
@@ -288,5 +317,6 @@ async def _astage_context_paths(
             ensure_ascii=False,
             indent=2,
         ),
+        ensured_dirs=ensured_dirs,
     )
     return staged_sources
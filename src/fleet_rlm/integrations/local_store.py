@@ -22,6 +22,7 @@ from sqlmodel import Field, Session, SQLModel, create_engine, select
 
 _DEFAULT_DB_DIR = Path(".data")
 _engines: dict[str, Any] = {}
+_encode_jsonl_row = json.JSONEncoder(ensure_ascii=False).encode
 
 
 def _iter_cached_engines() -> Iterator[Any]:
@@ -29,15 +30,14 @@ def _iter_cached_engines() -> Iterator[Any]:
     return iter(_engines.values())
 
 
-def _resolve_db_url(db_path: str | None = None) -> str:
-    """Resolve the effective database URL for the requested local store."""
+def _resolve_db_target(db_path: str | None = None) -> tuple[str, Path | None]:
+    """Resolve the database URL and, for local files, the directory to create."""
     env_url = os.environ.get("FLEET_RLM_LOCAL_DB_URL")
     if env_url:
-        return env_url
+        return env_url, None
 
     path = (Path(db_path) if db_path else _DEFAULT_DB_DIR / "local.db").expanduser()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    return f"sqlite:///{path.resolve()}"
+    return f"sqlite:///{path.resolve()}", path.parent
 
 
 def _migrate_optimization_runs(engine: Any) -> None:
@@ -145,11 +145,14 @@ def _migrate_evaluation_tables(engine: Any) -> None:
 
 def get_engine(db_path: str | None = None):
     """Return a cached SQLite engine, creating the DB file + tables on first call."""
-    url = _resolve_db_url(db_path)
+    url, db_dir = _resolve_db_target(db_path)
     engine = _engines.get(url)
     if engine is not None:
         return engine
 
+    # Only the first lookup per URL needs the directory; cached hits skip the mkdir.
+    if db_dir is not None:
+        db_dir.mkdir(parents=True, exist_ok=True)
     engine = create_engine(url, echo=False)
     SQLModel.metadata.create_all(engine)
     _migrate_optimization_runs(engine)
@@ -801,8 +804,7 @@ def _persist_transcript_dataset(
         suffix=".jsonl",
         delete=False,
     ) as fh:
-        for row in rows:
-            fh.write(json.dumps(row, ensure_ascii=False) + "\n")
+        fh.writelines(_encode_jsonl_row(row) + "\n" for row in rows)
         dest = Path(fh.name)
 
     return create_dataset(
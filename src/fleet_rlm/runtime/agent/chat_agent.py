@@ -649,9 +649,9 @@ class RLMReActChatAgent(DocumentCacheMixin, CoreMemoryMixin, dspy.Module):
             self._recursive_repair_module = PlanRecursiveRepairModule()
         return self._recursive_repair_module
 
-    def history_messages(self) -> list[Any]:
+    def history_messages(self, *, limit: int | None = None) -> list[Any]:
         """Return chat history messages as a defensive list copy."""
-        return chat_session_state.history_messages(self)
+        return chat_session_state.history_messages(self, limit=limit)
 
     def history_turns(self) -> int:
         """Return number of stored history turns safely."""
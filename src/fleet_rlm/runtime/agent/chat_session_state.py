@@ -60,19 +60,34 @@ def _enforce_history_cap(
     return [summary, *tail][-history_max_turns:]
 
 
-def history_messages(agent: RLMReActChatAgent) -> list[Any]:
-    """Return chat history messages as a defensive list copy."""
+def history_messages(
+    agent: RLMReActChatAgent, *, limit: int | None = None
+) -> list[Any]:
+    """Return chat history messages as a defensive list copy.
+
+    When ``limit`` is given only the most recent ``limit`` messages are
+    copied, so callers that need a short tail never copy the full history.
+    """
     messages = getattr(agent.history, "messages", None)
     if messages is None:
         return []
+    if limit is not None:
+        if limit <= 0:
+            return []
+        if isinstance(messages, list):
+            return messages[-limit:]
     try:
-        return list(messages)
+        copied = list(messages)
     except TypeError:
         return []
+    return copied if limit is None else copied[-limit:]
 
 
 def history_turns(agent: RLMReActChatAgent) -> int:
     """Return number of stored history turns safely."""
+    messages = getattr(agent.history, "messages", None)
+    if isinstance(messages, list):
+        return len(messages)
     return len(history_messages(agent))
 
 
@@ -207,7 +222,7 @@ def forced_delegate_context(agent: RLMReActChatAgent) -> str:
         parts.append(f"Core memory:\n{core_memory}")
 
     history_lines: list[str] = []
-    for item in history_messages(agent)[-6:]:
+    for item in history_messages(agent, limit=6):
         if not isinstance(item, dict):
             continue
         user_request = str(item.get("user_request", "") or "").strip()
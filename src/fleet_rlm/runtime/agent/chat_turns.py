@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
+import threading
 from typing import TYPE_CHECKING, Any, cast
 import uuid
 
@@ -17,6 +20,52 @@ if TYPE_CHECKING:
     from .chat_agent import RLMReActChatAgent
 
 logger = logging.getLogger(__name__)
+_persistence_loop: asyncio.AbstractEventLoop | None = None
+_persistence_loop_lock = threading.Lock()
+# The event loop only keeps weak references to tasks, so fire-and-forget
+# persistence tasks are held here until they finish.
+_persistence_tasks: set[asyncio.Task[Any]] = set()
+# Blocking local-store writes share one worker so turns land in the order
+# they were submitted instead of racing on separate threads.
+_local_persistence_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="fleet-turn-persist"
+)
+
+
+def _get_persistence_loop() -> asyncio.AbstractEventLoop:
+    global _persistence_loop
+    with _persistence_loop_lock:
+        if _persistence_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="fleet-persistence-loop",
+                daemon=True,
+            ).start()
+            _persistence_loop = loop
+        return _persistence_loop
+
+
+def run_persistence_coroutine(coro: Coroutine[Any, Any, None]) -> None:
+    """Run *coro* to completion on the shared persistence loop thread.
+
+    Pooled async DB connections are bound to the loop that opened them, so one
+    long-lived loop keeps them usable across turns and calling threads instead
+    of building a fresh loop per persisted turn or leaking one per thread.
+    """
+    asyncio.run_coroutine_threadsafe(coro, _get_persistence_loop()).result()
+
+
+def spawn_persistence_task(coro: Coroutine[Any, Any, Any]) -> None:
+    """Run *coro* in the background on the running loop without blocking it."""
+    task = asyncio.create_task(coro)
+    _persistence_tasks.add(task)
+    task.add_done_callback(_persistence_tasks.discard)
+
+
+def submit_local_persistence(write: Callable[[], None]) -> Future[None]:
+    """Queue the blocking local-store *write* behind every earlier one."""
+    return _local_persistence_executor.submit(write)
 
 
 @dataclass(slots=True)
@@ -415,25 +464,33 @@ def _persist_turn_best_effort(
             asyncio.get_running_loop()
         except RuntimeError:
             try:
-                asyncio.run(_persist_async())
+                run_persistence_coroutine(_persist_async())
             except Exception:
                 logger.debug(
                     "Failed to persist chat turn in Postgres",
                     exc_info=True,
                 )
         else:
-            asyncio.create_task(_persist_async())
+            spawn_persistence_task(_persist_async())
         return
 
-    try:
-        from fleet_rlm.integrations.local_store import add_turn
+    def _persist_local() -> None:
+        try:
+            from fleet_rlm.integrations.local_store import add_turn
 
-        add_turn(db_session_id, 0, message, assistant_response)
-    except Exception:
-        logger.debug(
-            "Failed to persist chat turn in local_store",
-            exc_info=True,
-        )
+            add_turn(db_session_id, 0, message, assistant_response)
+        except Exception:
+            logger.debug(
+                "Failed to persist chat turn in local_store",
+                exc_info=True,
+            )
+
+    write = submit_local_persistence(_persist_local)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        write.result()
+    # On a running loop the SQLite write stays queued off the event loop.
 
 
 def process_prediction_to_turn_result(
@@ -10,6 +10,8 @@ import asyncio
 import inspect
 from typing import TYPE_CHECKING, Any
 
+from .tool_delegation import react_tool_index
+
 if TYPE_CHECKING:
     from .chat_agent import RLMReActChatAgent
 
@@ -199,10 +201,8 @@ async def execute_command(
 
 def _resolve_tool(agent: RLMReActChatAgent, tool_name: str) -> Any:
     """Find a tool by name in the agent's tool list or as a method."""
-    for tool in getattr(agent, "react_tools", []):
-        name = getattr(tool, "name", None) or getattr(tool, "__name__", None)
-        if name != tool_name:
-            continue
+    tool = react_tool_index(agent).get(tool_name)
+    if tool is not None:
         return getattr(tool, "func", tool)
     # Fallback: direct method (e.g. reset)
     return getattr(agent, tool_name)
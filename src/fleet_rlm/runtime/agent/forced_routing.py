@@ -150,7 +150,9 @@ async def aiter_forced_rlm_turn_stream(
         payload=ctx.enrich({"tool_name": "rlm_query", "forced": True}),
     )
 
-    pending_events: asyncio.Queue[StreamEvent] = asyncio.Queue()
+    # ``None`` marks delegate completion, so the loop below can block on the
+    # queue instead of polling ``task.done()``.
+    pending_events: asyncio.Queue[StreamEvent | None] = asyncio.Queue()
 
     async def _queue_event(event: Any) -> None:
         if isinstance(event, StreamEvent):
@@ -164,6 +166,9 @@ async def aiter_forced_rlm_turn_stream(
             stream_event_callback=_queue_event,
         )
     )
+    task.add_done_callback(lambda _task: pending_events.put_nowait(None))
+    # A timed wait is only needed to re-check ``cancel_check``.
+    poll_timeout = 0.05 if cancel_check is not None else None
 
     try:
         while True:
@@ -183,13 +188,22 @@ async def aiter_forced_rlm_turn_stream(
                 )
                 return
 
-            try:
-                event = await asyncio.wait_for(pending_events.get(), timeout=0.05)
-            except asyncio.TimeoutError:
-                if task.done():
-                    break
-                continue
-
+            # Only arm a wait_for timer when nothing is queued; a burst of
+            # sub-agent events is drained without a task/timer per event.
+            if not pending_events.empty():
+                event = pending_events.get_nowait()
+            elif poll_timeout is None:
+                event = await pending_events.get()
+            else:
+                try:
+                    event = await asyncio.wait_for(
+                        pending_events.get(), timeout=poll_timeout
+                    )
+                except asyncio.TimeoutError:
+                    continue
+
+            if event is None:
+                break
             yield event
 
         forced_result = await task
@@ -199,9 +213,6 @@ async def aiter_forced_rlm_turn_stream(
             with suppress(asyncio.CancelledError):
                 _ = await task
 
-    while not pending_events.empty():
-        yield pending_events.get_nowait()
-
     prediction = prediction_from_forced_rlm_result(agent, forced_result)
     assistant_response, trajectory = prediction_response_and_trajectory(prediction)
     guardrail_warnings = prediction_guardrail_warnings(prediction)
@@ -71,6 +71,29 @@ TOOL_DELEGATE_NAMES: frozenset[str] = frozenset(
 )
 
 
+def react_tool_index(agent: Any) -> dict[str, Any]:
+    """Return a ``name -> tool`` map for ``agent.react_tools``.
+
+    The map is cached on the agent and rebuilt only when ``react_tools`` is
+    rebound or changes length, so name lookups skip the per-call scan. The
+    first tool wins on duplicate names, matching a linear search.
+    """
+    tools = getattr(agent, "react_tools", None) or []
+    state = getattr(agent, "__dict__", None)
+    cached = state.get("_react_tool_index") if state is not None else None
+    if cached is not None and cached[0] is tools and cached[1] == len(tools):
+        return cached[2]
+
+    index: dict[str, Any] = {}
+    for tool in tools:
+        tool_name = getattr(tool, "name", None) or getattr(tool, "__name__", None)
+        if tool_name is not None:
+            index.setdefault(tool_name, tool)
+    if state is not None:
+        state["_react_tool_index"] = (tools, len(tools), index)
+    return index
+
+
 def get_tool_by_name(agent: RLMReActChatAgent, name: str) -> Callable[..., Any]:
     """Look up a tool by name in the agent's tool list.
 
@@ -87,12 +110,11 @@ def get_tool_by_name(agent: RLMReActChatAgent, name: str) -> Callable[..., Any]:
     Raises:
         AttributeError: If no tool with the given name exists
     """
-    for tool in agent.react_tools:
-        tool_name = getattr(tool, "name", None) or getattr(tool, "__name__", None)
-        if tool_name == name:
-            # Return the underlying callable for dspy.Tool wrappers
-            fn = tool.func if isinstance(tool, dspy.Tool) else tool
-            return _sync_compatible_tool_callable(fn)
+    tool = react_tool_index(agent).get(name)
+    if tool is not None:
+        # Return the underlying callable for dspy.Tool wrappers
+        fn = tool.func if isinstance(tool, dspy.Tool) else tool
+        return _sync_compatible_tool_callable(fn)
     raise AttributeError(f"No tool named {name!r}")
 
 
@@ -144,20 +166,12 @@ class ToolDelegationMixin:
             AttributeError: If the attribute is not a known tool delegate
         """
         if name in TOOL_DELEGATE_NAMES:
-            # Use object.__getattribute__ to access _get_tool without recursion
-            # This assumes the class has a _get_tool method or uses get_tool_by_name
-            react_tools = object.__getattribute__(self, "react_tools")
-
-            # Find the tool
-            for tool in react_tools:
-                tool_name = getattr(tool, "name", None) or getattr(
-                    tool, "__name__", None
-                )
-                if tool_name == name:
-                    # Return the underlying callable for dspy.Tool wrappers
-                    if isinstance(tool, dspy.Tool):
-                        return _sync_compatible_tool_callable(tool.func)
-                    return _sync_compatible_tool_callable(tool)
+            tool = react_tool_index(self).get(name)
+            if tool is not None:
+                # Return the underlying callable for dspy.Tool wrappers
+                if isinstance(tool, dspy.Tool):
+                    return _sync_compatible_tool_callable(tool.func)
+                return _sync_compatible_tool_callable(tool)
 
             raise AttributeError(f"Tool {name!r} not found in react_tools")
 
@@ -55,15 +55,10 @@ def chunk_by_size(
     if overlap >= size:
         raise ValueError("overlap must be less than size")
 
-    chunks: list[str] = []
+    # The last chunk is the first one that reaches the end of the text.
     step = size - overlap
-    for start in range(0, len(text), step):
-        chunk = text[start : start + size]
-        if chunk:
-            chunks.append(chunk)
-        if start + size >= len(text):
-            break
-    return chunks
+    n_chunks = max(1, (len(text) - overlap + step - 1) // step)
+    return [text[i * step : i * step + size] for i in range(n_chunks)]
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -81,8 +81,9 @@ def sandbox_driver() -> None:
     # in the sandbox process.
     import json
     import sys
-    from contextlib import redirect_stderr, redirect_stdout
-    from io import StringIO
+    from collections import OrderedDict
+    from hashlib import blake2b
+    from io import TextIOBase
     from typing import Any, Callable, cast
 
     try:
@@ -156,6 +157,24 @@ def sandbox_driver() -> None:
         workspace_read = cast(Any, g.get("workspace_read"))
         workspace_write = cast(Any, g.get("workspace_write"))
 
+    class _ChunkWriter(TextIOBase):
+        """Capture stream that keeps written chunks and joins them once."""
+
+        def __init__(self) -> None:
+            self._chunks: list[str] = []
+
+        def writable(self) -> bool:
+            return True
+
+        def write(self, s: str) -> int:
+            if not isinstance(s, str):
+                raise TypeError(f"write() argument must be str, not {type(s).__name__}")
+            self._chunks.append(s)
+            return len(s)
+
+        def getvalue(self) -> str:
+            return "".join(self._chunks)
+
     # Reset module-level state for fresh start (each driver instance is independent)
     reset_session_history()
     reset_buffers()
@@ -167,8 +186,12 @@ def sandbox_driver() -> None:
     # Use list for mutable reference in closure
     current_execution_profile = ["RLM_DELEGATE"]
     _dynamic_tool_names: set[str] = set()
+    # (profile, tool names) of the last registration; skip identical re-runs.
+    _registered_tools_key: list[Any] = [None]
 
     output_names: list[str] = []
+    # SUBMIT stores its payload here; FinalOutput is only the control signal.
+    final_slot: list[Any] = []
 
     # Create protocol functions
     _send = make_send(proto_out)
@@ -208,16 +231,38 @@ def sandbox_driver() -> None:
         },
     )
 
+    # Bind loop-invariant callables once; the loop runs for every command.
+    read_line = input
+    loads = json.loads
+    decode_error = json.JSONDecodeError
+
+    # Compiled code objects keyed by source digest; ReAct loops often resend
+    # the same snippet, so repeats skip the compiler.
+    code_cache: OrderedDict[bytes, Any] = OrderedDict()
+    code_cache_size = 256
+
+    def _compile_cached(source: str) -> Any:
+        key = blake2b(source.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        code_obj = code_cache.get(key)
+        if code_obj is None:
+            code_obj = compile(source, "<string>", "exec")
+            code_cache[key] = code_obj
+            if len(code_cache) > code_cache_size:
+                code_cache.popitem(last=False)
+        else:
+            code_cache.move_to_end(key)
+        return code_obj
+
     # Main execution loop
     while True:
         try:
-            line = input()
+            line = read_line()
         except EOFError:
             break
 
         try:
-            command = json.loads(line)
-        except json.JSONDecodeError as exc:
+            command = loads(line)
+        except decode_error as exc:
             _send(
                 {"stdout": "", "stderr": f"[Error] Invalid JSON: {exc}", "final": None}
             )
@@ -244,7 +289,7 @@ def sandbox_driver() -> None:
             continue
 
         # Create SUBMIT for this execution
-        SUBMIT = make_submit(output_names)
+        SUBMIT = make_submit(output_names, final_slot)
         sandbox_globals["SUBMIT"] = SUBMIT
 
         # Create LLM query functions
@@ -253,28 +298,44 @@ def sandbox_driver() -> None:
         sandbox_globals["llm_query"] = llm_query
         sandbox_globals["llm_query_batched"] = llm_query_batched
 
-        sandbox_globals.update(variables)
-        register_tools(
-            tool_names,
-            sandbox_globals,
-            _dynamic_tool_names,
-            _tool_call,
-            current_execution_profile,
-        )
+        if variables:
+            sandbox_globals.update(variables)
+        tools_key = (execution_profile, frozenset(tool_names))
+        if tools_key != _registered_tools_key[0] or not _dynamic_tool_names.issubset(
+            sandbox_globals.keys()
+        ):
+            register_tools(
+                tool_names,
+                sandbox_globals,
+                _dynamic_tool_names,
+                _tool_call,
+                current_execution_profile,
+            )
+            _registered_tools_key[0] = tools_key
 
-        stdout_io = StringIO()
-        stderr_io = StringIO()
+        final_slot.clear()
+        stdout_io = _ChunkWriter()
+        stderr_io = _ChunkWriter()
         final_obj = None
 
         had_exec_error = False
-        with redirect_stdout(stdout_io), redirect_stderr(stderr_io):
-            try:
-                exec(code, sandbox_globals)
-            except FinalOutput as exc:
+        # Swap the streams directly; this runs for every command.
+        saved_stdout, saved_stderr = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = stdout_io, stderr_io
+        try:
+            exec(_compile_cached(code), sandbox_globals)
+        except FinalOutput as exc:
+            if final_slot:
+                final_obj = final_slot[-1]
+            else:
                 final_obj = exc.args[0] if exc.args else None
-            except Exception as exc:  # pragma: no cover
-                had_exec_error = True
-                print(f"[Error] {type(exc).__name__}: {exc}", file=sys.stderr)
+            # Drop the traceback so it does not pin sandbox frames.
+            exc.__traceback__ = None
+        except Exception as exc:  # pragma: no cover
+            had_exec_error = True
+            print(f"[Error] {type(exc).__name__}: {exc}", file=stderr_io)
+        finally:
+            sys.stdout, sys.stderr = saved_stdout, saved_stderr
 
         # Final Variable Convention: Check if 'Final' was set in globals.
         # Always clear it after execution to prevent stale values leaking into
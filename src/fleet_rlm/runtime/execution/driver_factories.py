@@ -6,8 +6,10 @@ used by the sandbox driver.
 
 from __future__ import annotations
 
+import io
 import json
-from typing import Any, Callable
+import os
+from typing import Any, Callable, NoReturn
 
 
 class FinalOutput(BaseException):
@@ -34,11 +36,41 @@ def make_send(proto_out: Any) -> Callable[[dict], None]:
         Function that sends JSON objects to the output stream.
     """
 
+    if proto_out is None:
+
+        def _discard(obj: dict) -> None:
+            return None
+
+        return _discard
+
+    dumps = json.dumps
+
+    # Prefer writing encoded lines straight to the descriptor: one syscall
+    # per message and no text-layer buffer to flush afterwards.
+    try:
+        fd = proto_out.fileno()
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        fd = None
+    if fd is not None:
+        flush_pending = getattr(proto_out, "flush", None)
+        if flush_pending is not None:
+            flush_pending()
+        os_write = os.write
+
+        def _send_fd(obj: dict) -> None:
+            view = memoryview((dumps(obj) + "\n").encode("utf-8"))
+            while view:
+                view = view[os_write(fd, view) :]
+
+        return _send_fd
+
+    # Resolve the stream methods once; they are stable for the driver lifetime.
+    write = proto_out.write
+    flush = getattr(proto_out, "flush", None) or (lambda: None)
+
     def _send(obj: dict) -> None:
-        if proto_out is None:
-            return
-        proto_out.write(json.dumps(obj) + "\n")
-        proto_out.flush()
+        write(dumps(obj) + "\n")
+        flush()
 
     return _send
 
@@ -53,9 +85,13 @@ def make_tool_call(send: Callable[[dict], None]) -> Callable[..., Any]:
         Function that makes tool calls and waits for responses.
     """
 
+    # Bind the reply reader once; every tool call reads exactly one line.
+    read_line = input
+    loads = json.loads
+
     def _tool_call(name: str, *args, **kwargs) -> Any:
         send({"tool_call": {"name": name, "args": list(args), "kwargs": kwargs}})
-        reply = json.loads(input())
+        reply = loads(read_line())
         if reply.get("tool_error"):
             raise RuntimeError(reply["tool_error"])
         return reply.get("tool_result")
@@ -90,33 +126,44 @@ def wrap_helper(
     return _wrapped
 
 
-def make_submit(output_names: list[str]) -> Callable[..., None]:
+def make_submit(
+    output_names: list[str], final_slot: list[Any] | None = None
+) -> Callable[..., None]:
     """Create a SUBMIT function for the given output names.
 
     Args:
         output_names: Expected output names for positional arguments.
+        final_slot: Optional list that receives the structured result. When
+            given, FinalOutput is raised without args and the caller reads
+            the value from the slot instead of the exception.
 
     Returns:
         SUBMIT function that raises FinalOutput with structured result.
     """
 
+    def _finish(payload: dict[str, Any]) -> NoReturn:
+        if final_slot is None:
+            raise FinalOutput(payload)
+        final_slot.append(payload)
+        raise FinalOutput
+
     def SUBMIT(*args, **kwargs) -> None:
         if kwargs:
-            raise FinalOutput(kwargs)
+            _finish(kwargs)
 
         if not output_names:
             if len(args) == 1:
-                raise FinalOutput({"output": args[0]})
-            raise FinalOutput({"output": list(args)})
+                _finish({"output": args[0]})
+            _finish({"output": list(args)})
 
         if len(args) != len(output_names):
-            raise FinalOutput(
+            _finish(
                 {
                     "error": f"SUBMIT expected {len(output_names)} positional values ({output_names}), got {len(args)}"
                 }
             )
 
-        raise FinalOutput(dict(zip(output_names, args)))
+        _finish(dict(zip(output_names, args)))
 
     return SUBMIT
 
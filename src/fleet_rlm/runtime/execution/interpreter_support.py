@@ -32,15 +32,16 @@ def initialize_llm_query_state(
     sub_lm: dspy.LM | None,
     max_llm_calls: int,
     llm_call_timeout: int,
+    llm_batch_fail_fast: bool = True,
 ) -> None:
     """Populate shared LLM-query state used by interpreter backends."""
     target.sub_lm = sub_lm
     target.max_llm_calls = max_llm_calls
     target.llm_call_timeout = llm_call_timeout
+    target.llm_batch_fail_fast = llm_batch_fail_fast
     target._llm_call_count = 0
     target._llm_call_lock = threading.Lock()
     target._sub_lm_executor = None
-    target._sub_lm_executor_lock = threading.Lock()
 
 
 def initialize_sub_rlm_state(
@@ -7,6 +7,10 @@ import json
 import os
 import re
 import subprocess
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
+from itertools import accumulate
 from typing import Any
 
 try:
@@ -43,15 +47,60 @@ def peek(text: str, start: int = 0, length: int = 2000) -> str:
     return text[start : start + length]
 
 
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    # Helpers are called repeatedly with the same patterns across REPL turns.
+    return re.compile(pattern, flags)
+
+
+def _strip_line_end(segment: str) -> str:
+    return segment.splitlines()[0] if segment else ""
+
+
+# The only single-character casefold that disagrees with re.IGNORECASE.
+_DOTLESS_I = "\u0131"
+
+
 def grep(text: str, pattern: str, *, context: int = 0) -> list[str]:
-    lines = text.splitlines()
-    pat = re.compile(re.escape(pattern), re.IGNORECASE)
+    segments = text.splitlines(keepends=True)
+    # A literal spanning a line boundary can never match within one line.
+    if not segments or pattern.splitlines() not in ([pattern], []):
+        return []
+    needle = pattern.casefold()
+    folded = text.casefold()
+    if (
+        len(folded) == len(text)
+        and len(needle) == len(pattern)
+        and _DOTLESS_I not in pattern
+        and _DOTLESS_I not in text
+    ):
+        # Casefolding kept every offset, so a C substring search on the
+        # folded text finds the same lines as a case-insensitive regex.
+        find = folded.find
+    else:
+        # Some character folds to several (e.g. "ß" -> "ss") and offsets
+        # shift, or the text has a dotless "ı", which re.IGNORECASE equates
+        # with "I" while casefold does not; use the regex scan instead.
+        pat = _compile_pattern(re.escape(pattern), re.IGNORECASE)
+
+        def find(_needle: str, start: int) -> int:
+            match = pat.search(text, start)
+            return -1 if match is None else match.start()
+
+    line_starts = list(accumulate(map(len, segments), initial=0))
+    n_lines = len(segments)
     hits: list[str] = []
-    for idx, line in enumerate(lines):
-        if pat.search(line):
-            lo = max(0, idx - context)
-            hi = min(len(lines), idx + context + 1)
-            hits.append("\n".join(lines[lo:hi]))
+    # Scan the whole text in C and resume at the next line after each hit,
+    # so each matching line is reported once.
+    pos = 0
+    while (start := find(needle, pos)) != -1:
+        idx = bisect_right(line_starts, start) - 1
+        if idx >= n_lines:
+            break
+        lo = max(0, idx - context)
+        hi = min(n_lines, idx + context + 1)
+        hits.append("\n".join(_strip_line_end(seg) for seg in segments[lo:hi]))
+        pos = line_starts[idx + 1]
     return hits
 
 
@@ -65,15 +114,10 @@ def chunk_by_size(text: str, size: int = 200_000, overlap: int = 0) -> list[str]
     if overlap >= size:
         raise ValueError("overlap must be less than size")
 
-    chunks: list[str] = []
+    # The last chunk is the first one that reaches the end of the text.
     step = size - overlap
-    for start in range(0, len(text), step):
-        chunk = text[start : start + size]
-        if chunk:
-            chunks.append(chunk)
-        if start + size >= len(text):
-            break
-    return chunks
+    n_chunks = max(1, (len(text) - overlap + step - 1) // step)
+    return [text[i * step : i * step + size] for i in range(n_chunks)]
 
 
 def chunk_by_headers(
@@ -84,7 +128,7 @@ def chunk_by_headers(
     if not text:
         return []
 
-    compiled = re.compile(pattern, flags | re.MULTILINE)
+    compiled = _compile_pattern(pattern, flags | re.MULTILINE)
     matches = list(compiled.finditer(text))
     if not matches:
         return [{"header": "", "content": text.strip(), "start_pos": 0}]
@@ -96,16 +140,18 @@ def chunk_by_headers(
             parts.append({"header": "", "content": preamble, "start_pos": 0})
 
     for idx, match in enumerate(matches):
+        start = match.start()
         end = matches[idx + 1].start() if idx + 1 < len(matches) else len(text)
-        section = text[match.start() : end]
-        newline_pos = section.find("\n")
+        # Slice header and content straight from the text by offset instead
+        # of copying the whole section first.
+        newline_pos = text.find("\n", start, end)
         if newline_pos == -1:
-            header = section.strip()
+            header = text[start:end].strip()
             content = ""
         else:
-            header = section[:newline_pos].strip()
-            content = section[newline_pos + 1 :].strip()
-        parts.append({"header": header, "content": content, "start_pos": match.start()})
+            header = text[start:newline_pos].strip()
+            content = text[newline_pos + 1 : end].strip()
+        parts.append({"header": header, "content": content, "start_pos": start})
     return parts
 
 
@@ -117,7 +163,7 @@ def chunk_by_timestamps(
     if not text:
         return []
 
-    compiled = re.compile(pattern, flags)
+    compiled = _compile_pattern(pattern, flags)
     matches = list(compiled.finditer(text))
     if not matches:
         return [{"timestamp": "", "content": text, "start_pos": 0}]
@@ -160,15 +206,21 @@ def chunk_by_json_keys(text: str) -> list[dict[str, Any]]:
     ]
 
 
-_buffers: dict[str, list[Any]] = {}
+_buffers: dict[str, deque[Any]] = {}
 
 
-def add_buffer(name: str, value: Any) -> None:
-    _buffers.setdefault(name, []).append(value)
+def add_buffer(name: str, value: Any, *, maxlen: int | None = None) -> None:
+    # ``maxlen`` applies when the buffer is created; a full buffer drops its
+    # oldest entries.
+    buffer = _buffers.get(name)
+    if buffer is None:
+        buffer = _buffers[name] = deque(maxlen=maxlen)
+    buffer.append(value)
 
 
 def get_buffer(name: str) -> list[Any]:
-    return list(_buffers.get(name, []))
+    buffer = _buffers.get(name)
+    return list(buffer) if buffer else []
 
 
 def clear_buffer(name: str | None = None) -> None:
@@ -191,16 +243,52 @@ def _resolve_volume_path(path: str) -> tuple[str | None, str | None]:
     )
 
 
+# A mounted volume stays mounted for the driver lifetime, so only a positive
+# probe is remembered; an unmounted volume is re-checked on the next call.
+_volume_mounted = False
+# Parent directories already created by this process.
+_created_dirs: set[str] = set()
+
+
+def _volume_available() -> bool:
+    global _volume_mounted
+    if not _volume_mounted:
+        _volume_mounted = os.path.isdir("/data")
+    return _volume_mounted
+
+
+def _write_text(full: str, content: str, mode: str, base: str) -> None:
+    parent = os.path.dirname(full) or base
+    if parent not in _created_dirs:
+        os.makedirs(parent, exist_ok=True)
+        _created_dirs.add(parent)
+    try:
+        with open(full, mode, encoding="utf-8") as fh:
+            fh.write(content)
+    except FileNotFoundError:
+        # The directory was removed after it was first created; open() failed
+        # before anything was written, so retrying the whole write is safe.
+        os.makedirs(parent, exist_ok=True)
+        with open(full, mode, encoding="utf-8") as fh:
+            fh.write(content)
+
+
+def _read_text(full: str) -> str:
+    try:
+        with open(full, encoding="utf-8") as fh:
+            return fh.read()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return f"[error: file not found: {full}]"
+
+
 def save_to_volume(path: str, content: str) -> str:
     base = "/data"
-    if not os.path.isdir(base):
+    if not _volume_available():
         return "[error: no volume mounted at /data]"
     full, path_error = _resolve_volume_path(path)
     if path_error is not None or full is None:
         return path_error or "[error: invalid volume path]"
-    os.makedirs(os.path.dirname(full) or base, exist_ok=True)
-    with open(full, "w", encoding="utf-8") as fh:
-        fh.write(content)
+    _write_text(full, content, "w", base)
     try:
         os.sync()
     except AttributeError:
@@ -216,10 +304,7 @@ def load_from_volume(path: str) -> str:
     full, path_error = _resolve_volume_path(path)
     if path_error is not None or full is None:
         return path_error or "[error: invalid volume path]"
-    if not os.path.isfile(full):
-        return f"[error: file not found: {full}]"
-    with open(full, encoding="utf-8") as fh:
-        return fh.read()
+    return _read_text(full)
 
 
 WORKSPACE_BASE = "/data/workspace"
@@ -238,14 +323,11 @@ def workspace_write(path: str, content: str) -> str:
     full, path_error = _resolve_workspace_path(path)
     if path_error is not None:
         return path_error
-    if not os.path.isdir("/data"):
+    if not _volume_available():
         return "[error: no volume mounted at /data]"
-    os.makedirs(WORKSPACE_BASE, exist_ok=True)
     if full is None:
         return "[error: invalid workspace path]"
-    os.makedirs(os.path.dirname(full) or WORKSPACE_BASE, exist_ok=True)
-    with open(full, "w", encoding="utf-8") as fh:
-        fh.write(content)
+    _write_text(full, content, "w", WORKSPACE_BASE)
     return full
 
 
@@ -255,10 +337,7 @@ def workspace_read(path: str) -> str:
         return path_error
     if full is None:
         return "[error: invalid workspace path]"
-    if not os.path.isfile(full):
-        return f"[error: file not found: {full}]"
-    with open(full, encoding="utf-8") as fh:
-        return fh.read()
+    return _read_text(full)
 
 
 def workspace_list(pattern: str = "*") -> list[str]:
@@ -283,12 +362,9 @@ def workspace_append(path: str, content: str) -> str:
     full, path_error = _resolve_workspace_path(path)
     if path_error is not None:
         return path_error
-    if not os.path.isdir("/data"):
+    if not _volume_available():
         return "[error: no volume mounted at /data]"
-    os.makedirs(WORKSPACE_BASE, exist_ok=True)
     if full is None:
         return "[error: invalid workspace path]"
-    os.makedirs(os.path.dirname(full) or WORKSPACE_BASE, exist_ok=True)
-    with open(full, "a", encoding="utf-8") as fh:
-        fh.write(content)
+    _write_text(full, content, "a", WORKSPACE_BASE)
     return full
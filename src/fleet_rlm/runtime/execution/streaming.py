@@ -120,35 +120,34 @@ def _persist_streaming_turn_best_effort(
             try:
                 asyncio.get_running_loop()
             except RuntimeError:
+                from fleet_rlm.runtime.agent.chat_turns import (
+                    run_persistence_coroutine,
+                )
+
                 try:
-                    asyncio.run(_write_turn_repo_async())
+                    run_persistence_coroutine(_write_turn_repo_async())
                 except Exception:
                     logger.exception(error_log_message, *error_log_args)
             else:
-                asyncio.create_task(_write_turn_repo_async())
+                from fleet_rlm.runtime.agent.chat_turns import spawn_persistence_task
+
+                spawn_persistence_task(_write_turn_repo_async())
             return
 
     from fleet_rlm.integrations.local_store import add_turn
+    from fleet_rlm.runtime.agent.chat_turns import submit_local_persistence
 
     def _write_turn() -> None:
-        add_turn(db_session_id, 0, user_message, assistant_message)
-
-    async def _write_turn_async() -> None:
         try:
-            await asyncio.to_thread(_write_turn)
+            add_turn(db_session_id, 0, user_message, assistant_message)
         except Exception:
             logger.exception(error_log_message, *error_log_args)
 
+    write = submit_local_persistence(_write_turn)
     try:
         asyncio.get_running_loop()
     except RuntimeError:
-        try:
-            _write_turn()
-        except Exception:
-            logger.exception(error_log_message, *error_log_args)
-        return
-
-    asyncio.create_task(_write_turn_async())
+        write.result()
 
 
 @dataclass(slots=True)
@@ -360,6 +359,33 @@ def _build_fallback_events(
     )
 
 
+def _build_partial_stream_error_event(
+    *,
+    exc: Exception,
+    agent: RLMReActChatAgent,
+    assistant_chunks: list[str],
+    ctx: StreamingContext,
+) -> StreamEvent:
+    """Build the terminal error event for a stream that failed mid-answer.
+
+    Once answer tokens have reached the client, re-running the whole turn
+    through the non-streaming path would repeat every LM and tool call, so
+    the turn ends here with the partial text attached instead.
+    """
+    return StreamEvent(
+        kind="error",
+        flush_tokens=True,
+        text=f"stream error after partial response ({exc})",
+        payload=ctx.enrich(
+            {
+                "error_type": type(exc).__name__,
+                "partial_response": "".join(assistant_chunks),
+                "history_turns": agent.history_turns(),
+            }
+        ),
+    )
+
+
 def _drain_live_events(
     pending_events: list[StreamEvent],
 ) -> Iterable[StreamEvent]:
@@ -604,6 +630,20 @@ def iter_chat_turn_stream(
                     ctx=ctx,
                 )
     except Exception as exc:
+        if state.assistant_chunks:
+            logger.error(
+                "Streaming error after partial response: %s",
+                exc,
+                exc_info=True,
+                extra={"error_type": type(exc).__name__},
+            )
+            yield _build_partial_stream_error_event(
+                exc=exc,
+                agent=agent,
+                assistant_chunks=state.assistant_chunks,
+                ctx=ctx,
+            )
+            return
         logger.error(
             "Streaming error, falling back: %s",
             exc,
@@ -712,6 +752,20 @@ async def aiter_chat_turn_stream(
             ):
                 yield event
     except Exception as exc:
+        if state.assistant_chunks:
+            logger.error(
+                "Async streaming error after partial response: %s",
+                exc,
+                exc_info=True,
+                extra={"error_type": type(exc).__name__},
+            )
+            yield _build_partial_stream_error_event(
+                exc=exc,
+                agent=agent,
+                assistant_chunks=state.assistant_chunks,
+                ctx=ctx,
+            )
+            return
         logger.error(
             "Async streaming error, falling back: %s",
             exc,
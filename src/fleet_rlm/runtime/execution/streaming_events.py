@@ -168,12 +168,21 @@ _ALLOWED_EXTERNAL_URL_SCHEMES = frozenset({"http", "https"})
 
 
 def _extract_step_indices(raw: dict[str, Any]) -> list[int]:
-    indices: set[int] = set()
+    # DSPy writes each step's keys together and in ascending order, so the
+    # common case needs no set or sort; anything else falls back to both.
+    indices: list[int] = []
+    last_suffix = None
+    ordered = True
     for key in raw:
-        parts = key.rsplit("_", 1)
-        if len(parts) == 2 and parts[1].isdigit():
-            indices.add(int(parts[1]))
-    return sorted(indices)
+        _, sep, suffix = key.rpartition("_")
+        if not sep or suffix == last_suffix or not suffix.isdigit():
+            continue
+        last_suffix = suffix
+        index = int(suffix)
+        if indices and index <= indices[-1]:
+            ordered = False
+        indices.append(index)
+    return indices if ordered else sorted(set(indices))
 
 
 def _build_flat_trajectory_step(raw: dict[str, Any], index: int) -> dict[str, Any]:
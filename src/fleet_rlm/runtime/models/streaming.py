@@ -1,12 +1,13 @@
-"""Pydantic models used by the interactive coding CLI runtime."""
+"""Config models and event records used by the interactive coding CLI runtime."""
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 TraceMode = Literal["compact", "verbose", "off"]
 
@@ -43,7 +44,8 @@ class SessionConfig(BaseModel):
     stream_refresh_ms: int = 40
 
 
-class CommandResult(BaseModel):
+@dataclass(slots=True)
+class CommandResult:
     """Structured command execution result for UI rendering."""
 
     ok: bool = True
@@ -52,11 +54,12 @@ class CommandResult(BaseModel):
     payload: dict | list | str | None = None
 
 
-class TranscriptEvent(BaseModel):
+@dataclass(slots=True)
+class TranscriptEvent:
     """JSONL event persisted for a chat session transcript."""
 
     role: Literal["user", "assistant", "system", "trace", "status"]
-    content: str = Field(default="")
+    content: str = ""
     payload: dict | None = None
 
 
@@ -98,7 +101,6 @@ class TurnState:
     """Accumulates stream events into a render-ready turn state."""
 
     assistant_tokens: list[str] = field(default_factory=list)
-    transcript_text: str = ""
     reasoning_lines: list[str] = field(default_factory=list)
     tool_timeline: list[str] = field(default_factory=list)
     status_lines: list[str] = field(default_factory=list)
@@ -114,90 +116,116 @@ class TurnState:
     errored: bool = False
     done: bool = False
     error_message: str = ""
+    # Tokens are joined lazily; the cache covers the first ``_transcript_tokens``
+    # tokens and is extended with only the new ones on the next read.
+    _transcript_text: str = field(default="", repr=False)
+    _transcript_tokens: int = field(default=0, repr=False)
+    _transcript_overridden: bool = field(default=False, repr=False)
+
+    @property
+    def transcript_text(self) -> str:
+        """Return the assistant text accumulated so far."""
+        token_count = len(self.assistant_tokens)
+        if self._transcript_tokens != token_count:
+            if self._transcript_overridden or self._transcript_tokens > token_count:
+                self._transcript_text = "".join(self.assistant_tokens)
+                self._transcript_overridden = False
+            else:
+                self._transcript_text += "".join(
+                    self.assistant_tokens[self._transcript_tokens :]
+                )
+            self._transcript_tokens = token_count
+        return self._transcript_text
+
+    @transcript_text.setter
+    def transcript_text(self, value: str) -> None:
+        self._transcript_text = value
+        self._transcript_tokens = len(self.assistant_tokens)
+        self._transcript_overridden = True
 
     def apply(self, event: StreamEvent) -> None:
         """Apply one event to state in a deterministic way."""
-        if event.kind == "assistant_token":
-            token = event.text
-            self.assistant_tokens.append(token)
-            self.stream_chunks.append(token)
-            self.token_count += 1
-            self.transcript_text = "".join(self.assistant_tokens)
-            return
-
-        if event.kind == "status":
-            if event.text:
-                self.status_lines.append(event.text)
-                self.status_messages.append(event.text)
-                self.reasoning_lines.append(event.text)
-            return
-
-        if event.kind == "warning":
-            if event.text:
-                self.status_lines.append(event.text)
-                self.status_messages.append(event.text)
-                self.reasoning_lines.append(event.text)
-                self.tool_timeline.append(event.text)
-            return
-
-        if event.kind == "reasoning_step":
-            if event.text:
-                self.reasoning_lines.append(event.text)
-                self.thought_chunks.append(event.text)
-            return
-
-        if event.kind == "tool_call":
-            if event.text:
-                self.tool_timeline.append(event.text)
-            return
-
-        if event.kind == "tool_result":
-            if event.text:
-                self.tool_timeline.append(event.text)
-            return
-
-        if event.kind == "trajectory_step":
-            step_data = event.payload.get("step_data", {})
-            if step_data:
-                current_steps = self.trajectory.get("steps", [])
-                current_steps.append(step_data)
-                self.trajectory["steps"] = current_steps
-            return
-
-        if event.kind in ("plan_update", "rlm_executing", "memory_update"):
-            if event.text:
-                # Maintain CLI backward compatibility by casting these as status/timeline noise
-                self.status_lines.append(event.text)
-                self.tool_timeline.append(event.text)
-            return
-
-        if event.kind == "final":
-            final_text = event.text or self.transcript_text
-            self.final_text = final_text
-            self.transcript_text = final_text
-            self.trajectory = dict(event.payload.get("trajectory", {}) or {})
-            self.final_reasoning = event.payload.get("final_reasoning", "")
-            self.history_turns = int(
-                event.payload.get("history_turns", self.history_turns)
-            )
-            self.done = True
-            return
-
-        if event.kind == "cancelled":
-            self.cancelled = True
-            self.done = True
-            cancelled_text = event.text or self.transcript_text
-            self.final_text = cancelled_text
-            self.transcript_text = cancelled_text
-            self.history_turns = int(
-                event.payload.get("history_turns", self.history_turns)
-            )
-            return
-
-        if event.kind == "error":
-            self.errored = True
-            self.done = True
-            self.error_message = event.text or "unknown error"
-            self.history_turns = int(
-                event.payload.get("history_turns", self.history_turns)
-            )
+        handler = self._HANDLERS.get(event.kind)
+        if handler is not None:
+            handler(self, event)
+
+    def _on_assistant_token(self, event: StreamEvent) -> None:
+        token = event.text
+        self.assistant_tokens.append(token)
+        self.stream_chunks.append(token)
+        self.token_count += 1
+
+    def _on_status(self, event: StreamEvent) -> None:
+        if event.text:
+            self.status_lines.append(event.text)
+            self.status_messages.append(event.text)
+            self.reasoning_lines.append(event.text)
+
+    def _on_warning(self, event: StreamEvent) -> None:
+        if event.text:
+            self.status_lines.append(event.text)
+            self.status_messages.append(event.text)
+            self.reasoning_lines.append(event.text)
+            self.tool_timeline.append(event.text)
+
+    def _on_reasoning_step(self, event: StreamEvent) -> None:
+        if event.text:
+            self.reasoning_lines.append(event.text)
+            self.thought_chunks.append(event.text)
+
+    def _on_tool_event(self, event: StreamEvent) -> None:
+        if event.text:
+            self.tool_timeline.append(event.text)
+
+    def _on_trajectory_step(self, event: StreamEvent) -> None:
+        step_data = event.payload.get("step_data", {})
+        if step_data:
+            current_steps = self.trajectory.get("steps", [])
+            current_steps.append(step_data)
+            self.trajectory["steps"] = current_steps
+
+    def _on_runtime_notice(self, event: StreamEvent) -> None:
+        if event.text:
+            # Maintain CLI backward compatibility by casting these as status/timeline noise
+            self.status_lines.append(event.text)
+            self.tool_timeline.append(event.text)
+
+    def _on_final(self, event: StreamEvent) -> None:
+        final_text = event.text or self.transcript_text
+        self.final_text = final_text
+        self.transcript_text = final_text
+        self.trajectory = dict(event.payload.get("trajectory", {}) or {})
+        self.final_reasoning = event.payload.get("final_reasoning", "")
+        self.history_turns = int(event.payload.get("history_turns", self.history_turns))
+        self.done = True
+
+    def _on_cancelled(self, event: StreamEvent) -> None:
+        self.cancelled = True
+        self.done = True
+        cancelled_text = event.text or self.transcript_text
+        self.final_text = cancelled_text
+        self.transcript_text = cancelled_text
+        self.history_turns = int(event.payload.get("history_turns", self.history_turns))
+
+    def _on_error(self, event: StreamEvent) -> None:
+        self.errored = True
+        self.done = True
+        self.error_message = event.text or "unknown error"
+        self.history_turns = int(event.payload.get("history_turns", self.history_turns))
+
+    # One dict lookup per event instead of a cascade of kind comparisons.
+    _HANDLERS: ClassVar[dict[str, Callable[[TurnState, StreamEvent], None]]] = {
+        "assistant_token": _on_assistant_token,
+        "status": _on_status,
+        "warning": _on_warning,
+        "reasoning_step": _on_reasoning_step,
+        "tool_call": _on_tool_event,
+        "tool_result": _on_tool_event,
+        "trajectory_step": _on_trajectory_step,
+        "plan_update": _on_runtime_notice,
+        "rlm_executing": _on_runtime_notice,
+        "memory_update": _on_runtime_notice,
+        "final": _on_final,
+        "cancelled": _on_cancelled,
+        "error": _on_error,
+    }
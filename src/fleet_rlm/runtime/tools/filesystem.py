@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+import subprocess
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -148,41 +151,73 @@ def _read_file_slice_impl(
     }
 
 
+_MAX_FIND_HITS = 20
+_RG_MATCH_PREFIX = '{"type":"match"'
+
+
 def _find_files_impl(
     _ctx: _FilesystemToolContext, pattern: str, path: str = ".", include: str = ""
 ) -> dict[str, Any]:
     """Search file contents on the host using regex pattern (ripgrep)."""
-    try:
-        from ripgrepy import Ripgrepy  # ty: ignore[unresolved-import]
-    except ImportError:
-        return {
-            "status": "error",
-            "error": "ripgrepy not installed (install with 'interactive' extra)",
-        }
-
-    rg = Ripgrepy(pattern, path).json().with_filename().line_number().max_count(50)
+    command = ["rg", "--json", "--with-filename", "--line-number", "--max-count", "50"]
     if include:
-        rg = rg.glob(include)
-
-    try:
-        out = rg.run()
-    except Exception as exc:
-        return {
-            "status": "error",
-            "pattern": pattern,
-            "path": path,
-            "error": str(exc),
-        }
-
-    hits = []
-    for item in out.as_dict:
-        if item.get("type") != "match":
-            continue
-        data = item.get("data", {})
-        path_text = data.get("path", {}).get("text", "")
-        line_no = data.get("line_number")
-        line_text = data.get("lines", {}).get("text", "").rstrip("\n")
-        hits.append({"path": path_text, "line": line_no, "text": line_text})
+        command.extend(["--glob", include])
+    command.extend(["--", pattern, path])
+
+    hits: list[dict[str, Any]] = []
+    truncated = False
+    # Stream rg's JSON lines and stop once enough hits are collected instead of
+    # buffering the whole result set.
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            proc = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except OSError as exc:
+            return {
+                "status": "error",
+                "pattern": pattern,
+                "path": path,
+                "error": f"ripgrep (rg) is not available: {exc}",
+            }
+
+        if proc.stdout is None:
+            proc.kill()
+            proc.wait()
+            return {
+                "status": "error",
+                "pattern": pattern,
+                "path": path,
+                "error": "ripgrep (rg) did not provide an output stream",
+            }
+        with proc:
+            for line in proc.stdout:
+                if not line.startswith(_RG_MATCH_PREFIX):
+                    continue
+                if len(hits) >= _MAX_FIND_HITS:
+                    truncated = True
+                    proc.terminate()
+                    break
+                data = json.loads(line).get("data", {})
+                path_text = data.get("path", {}).get("text", "")
+                line_no = data.get("line_number")
+                line_text = data.get("lines", {}).get("text", "").rstrip("\n")
+                hits.append({"path": path_text, "line": line_no, "text": line_text})
+
+        if proc.returncode == 2 and not hits:
+            stderr_file.seek(0)
+            error = stderr_file.read().decode("utf-8", errors="replace").strip()
+            return {
+                "status": "error",
+                "pattern": pattern,
+                "path": path,
+                "error": error or "ripgrep exited with status 2",
+            }
 
     return {
         "status": "ok",
@@ -190,7 +225,8 @@ def _find_files_impl(
         "search_path": path,
         "include": include or "all files",
         "count": len(hits),
-        "hits": hits[:20],
+        "truncated": truncated,
+        "hits": hits,
     }
 
 
@@ -230,6 +266,10 @@ def build_filesystem_tools(agent: RLMReActChatAgent) -> list[Any]:
         Tool(
             find_files,
             name="find_files",
-            desc="Search file contents on the host using regex pattern (ripgrep)",
+            desc=(
+                "Search file contents on the host using regex pattern (ripgrep). "
+                f"Returns at most {_MAX_FIND_HITS} hits; 'count' is the number of "
+                "hits returned and 'truncated' is true when more matches exist"
+            ),
         ),
     ]
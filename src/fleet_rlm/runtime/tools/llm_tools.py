@@ -16,13 +16,16 @@ import contextvars
 import logging
 import threading
 from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_EXCEPTION,
     ThreadPoolExecutor,
     as_completed,
+    wait,
 )
 from concurrent.futures import (
     TimeoutError as FutureTimeoutError,
 )
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NoReturn, cast
 
 import dspy
 
@@ -37,6 +40,26 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _lm_response_text(response: Any) -> str:
+    """Extract the completion text from a dspy LM response.
+
+    ``dspy.LM`` returns a list of strings (or ``{"text": ...}`` dicts when
+    logprobs/tool calls are requested); the common shapes return without an
+    extra ``str()`` copy.
+    """
+    if isinstance(response, list) and response:
+        item = response[0]
+        if type(item) is str:
+            return item
+        if isinstance(item, dict) and "text" in item:
+            text = item["text"]
+            return text if isinstance(text, str) else str(text)
+        return str(item)
+    if isinstance(response, str):
+        return response
+    return str(response)
+
+
 class LLMQueryMixin:
     """Mixin providing LLM query tools for recursive LLM calls.
 
@@ -47,10 +70,10 @@ class LLMQueryMixin:
         sub_lm: Optional LM for llm_query/llm_query_batched calls.
         max_llm_calls: Maximum number of sub-LLM calls allowed per session.
         llm_call_timeout: Timeout in seconds for individual LLM calls.
+        llm_batch_fail_fast: Abort llm_query_batched on the first failure.
         _llm_call_count: Counter for tracking LLM calls.
         _llm_call_lock: Thread lock for counter synchronization.
-        _sub_lm_executor: ThreadPoolExecutor for LLM calls.
-        _sub_lm_executor_lock: Lock for executor creation.
+        _sub_lm_executor: Per-interpreter ThreadPoolExecutor created in start().
 
     Methods:
         llm_query: Query a sub-LLM with a single prompt.
@@ -63,10 +86,10 @@ class LLMQueryMixin:
     sub_lm: dspy.LM | None
     max_llm_calls: int
     llm_call_timeout: int
+    llm_batch_fail_fast: bool
     _llm_call_count: int
     _llm_call_lock: threading.Lock
     _sub_lm_executor: ThreadPoolExecutor | None
-    _sub_lm_executor_lock: threading.Lock
 
     def build_delegate_child(self, *, remaining_llm_budget: int) -> Any:
         """Create a child interpreter — implemented by the host class."""
@@ -81,13 +104,22 @@ class LLMQueryMixin:
         Raises:
             RuntimeError: If the call would exceed max_llm_calls limit.
         """
+        # The counter only ever grows, so an over-budget read outside the lock
+        # is already final; reject it without contending for the lock.
+        current = self._llm_call_count
+        if current + n > self.max_llm_calls:
+            self._raise_llm_call_limit(current, n)
         with self._llm_call_lock:
-            if self._llm_call_count + n > self.max_llm_calls:
-                raise RuntimeError(
-                    f"LLM call limit exceeded: {self._llm_call_count} + {n} > {self.max_llm_calls}. "
-                    f"Use Python code for aggregation instead of making more LLM calls."
-                )
-            self._llm_call_count += n
+            current = self._llm_call_count
+            if current + n > self.max_llm_calls:
+                self._raise_llm_call_limit(current, n)
+            self._llm_call_count = current + n
+
+    def _raise_llm_call_limit(self, current: int, n: int) -> NoReturn:
+        raise RuntimeError(
+            f"LLM call limit exceeded: {current} + {n} > {self.max_llm_calls}. "
+            f"Use Python code for aggregation instead of making more LLM calls."
+        )
 
     def _query_sub_lm(self, prompt: str) -> str:
         """Query the sub-LM with a prompt string.
@@ -107,30 +139,23 @@ class LLMQueryMixin:
                 "No LM configured. Use dspy.configure(lm=...) or pass sub_lm to the active interpreter."
             )
 
-        # Execute LM call with timeout to prevent hangs
+        # Execute LM call with timeout to prevent hangs. The executor bound is
+        # kept even for LMs with a native request timeout: LiteLLM applies that
+        # per HTTP attempt and retries multiply it, so only the executor caps
+        # wall-clock time at llm_call_timeout.
         def _execute_lm() -> str:
-            response = target_lm(prompt)
-            if isinstance(response, list) and response:
-                item = response[0]
-                if isinstance(item, dict) and "text" in item:
-                    return item["text"]
-                return str(item)
-            return str(response)
+            return _lm_response_text(target_lm(prompt))
 
         # Reuse an executor with modest concurrency to avoid creating unbounded
         # threads when repeated calls time out, while not serializing all calls.
-        with self._sub_lm_executor_lock:
-            if self._sub_lm_executor is None:
-                self._sub_lm_executor = ThreadPoolExecutor(
-                    max_workers=min(8, max(1, self.max_llm_calls))
-                )
-            executor = self._sub_lm_executor
+        executor = self._sub_lm_executor
+        if executor is None:
+            executor = self._start_sub_lm_executor()
 
         ctx = contextvars.copy_context()
         future = executor.submit(ctx.run, _execute_lm)
         try:
-            result = future.result(timeout=self.llm_call_timeout)
-            return result if isinstance(result, str) else str(result)
+            return future.result(timeout=self.llm_call_timeout)
         except FutureTimeoutError as exc:
             future.cancel()
             raise RuntimeError(
@@ -138,6 +163,29 @@ class LLMQueryMixin:
                 "Consider increasing llm_call_timeout or checking API connectivity."
             ) from exc
 
+    def _start_sub_lm_executor(self) -> ThreadPoolExecutor:
+        """Create this interpreter's sub-LM executor if it is not running.
+
+        Hosts call this from ``start()``; ``_query_sub_lm`` only falls back to
+        it for hosts that issue LLM calls without being started first.
+        """
+        with self._llm_call_lock:
+            executor = self._sub_lm_executor
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=min(8, max(1, self.max_llm_calls)),
+                    thread_name_prefix="fleet-sub-lm",
+                )
+                self._sub_lm_executor = executor
+        return executor
+
+    def _shutdown_sub_lm_executor(self) -> None:
+        """Stop the sub-LM executor without waiting on hung calls."""
+        executor = self._sub_lm_executor
+        self._sub_lm_executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def llm_query(self, prompt: str) -> str:
         """Query a sub-LLM for semantic analysis.
 
@@ -188,12 +236,14 @@ class LLMQueryMixin:
 
         results: dict[int, str] = {}
         errors: list[tuple[int, Exception]] = []
+        fail_fast = self.llm_batch_fail_fast
 
         # Adaptive ThreadPool sizing: use min of max_llm_calls and 8, or batch size
         # This prevents over-allocation for small batches and under-utilization for large ones
         adaptive_workers = max(1, min(len(prompts), self.max_llm_calls, 8))
 
-        with ThreadPoolExecutor(max_workers=adaptive_workers) as executor:
+        executor = ThreadPoolExecutor(max_workers=adaptive_workers)
+        try:
             future_to_idx = {
                 # Copy a fresh context per task. Reusing one Context object
                 # across concurrent threads can raise:
@@ -203,13 +253,20 @@ class LLMQueryMixin:
                 ): i
                 for i, p in enumerate(prompts)
             }
-            for future in as_completed(future_to_idx):
-                idx = int(future_to_idx[future])
-                try:
-                    value = future.result()
-                    results[idx] = value if isinstance(value, str) else str(value)
-                except Exception as exc:
-                    errors.append((idx, exc))
+            done, _ = wait(
+                future_to_idx,
+                return_when=FIRST_EXCEPTION if fail_fast else ALL_COMPLETED,
+            )
+            for future in done:
+                idx = future_to_idx[future]
+                exc = future.exception()
+                if exc is not None:
+                    errors.append((idx, cast(Exception, exc)))
+                    continue
+                results[idx] = future.result()
+        finally:
+            # On a fail-fast exit, drop queued prompts instead of waiting on them.
+            executor.shutdown(wait=not errors, cancel_futures=bool(errors))
 
         if errors:
             errors.sort(key=lambda x: x[0])
@@ -365,8 +422,8 @@ class LLMQueryMixin:
 
     def _remaining_llm_budget(self) -> int:
         """Return how many LLM calls remain in the shared budget."""
-        with self._llm_call_lock:
-            return max(0, self.max_llm_calls - self._llm_call_count)
+        # A single attribute read is atomic; no lock needed for a snapshot.
+        return max(0, self.max_llm_calls - self._llm_call_count)
 
 
 # ---------------------------------------------------------------------------
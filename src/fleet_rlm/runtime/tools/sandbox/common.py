@@ -226,6 +226,40 @@ def _document_load_result(
     return response
 
 
+def _daytona_workspace_file_exists(session: Any, resolved_path: str) -> bool:
+    """Return whether *resolved_path* is a regular file in the sandbox.
+
+    Uses a single ``get_file_info`` probe when the session exposes one and
+    only falls back to scanning the parent listing otherwise.
+    """
+    get_file_info = getattr(session, "get_file_info", None)
+    if callable(get_file_info):
+        try:
+            info = get_file_info(resolved_path)
+        except (AttributeError, NotImplementedError):
+            pass
+        except Exception as exc:
+            if _is_daytona_missing_file_error(exc):
+                return False
+            raise
+        else:
+            return not bool(getattr(info, "is_dir", False))
+
+    parent_path = str(PurePosixPath(resolved_path).parent)
+    file_name = PurePosixPath(resolved_path).name
+    try:
+        entries = session.list_files(parent_path)
+    except Exception as exc:
+        if _is_daytona_missing_file_error(exc):
+            return False
+        raise
+
+    for entry in entries:
+        if str(getattr(entry, "name", "") or "") == file_name:
+            return not bool(getattr(entry, "is_dir", False))
+    return False
+
+
 def _load_daytona_workspace_text_sync(
     ctx: _SandboxToolContext,
     *,
@@ -248,26 +282,7 @@ def _load_daytona_workspace_text_sync(
         return None
 
     resolved_path = str(PurePosixPath(workspace_path) / candidate)
-    parent_path = str(PurePosixPath(resolved_path).parent)
-    file_name = PurePosixPath(resolved_path).name
-
-    try:
-        entries = session.list_files(parent_path)
-    except Exception as exc:
-        if _is_daytona_missing_file_error(exc):
-            return None
-        raise
-
-    has_file = False
-    for entry in entries:
-        if str(getattr(entry, "name", "") or "") != file_name:
-            continue
-        if bool(getattr(entry, "is_dir", False)):
-            return None
-        has_file = True
-        break
-
-    if not has_file:
+    if not _daytona_workspace_file_exists(session, resolved_path):
         return None
 
     try:
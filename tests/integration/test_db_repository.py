@@ -83,6 +83,19 @@ async def test_repository_smoke_flow(repository: FleetRepository):
         )
     )
 
+    batch = await repository.append_steps(
+        [
+            RunStepCreateRequest(
+                tenant_id=identity.tenant_id,
+                run_id=run.id,
+                step_index=index,
+                step_type=RunStepType.TOOL_CALL,
+            )
+            for index in (2, 3)
+        ]
+    )
+    assert [item.step_index for item in batch] == [2, 3]
+
     await repository.store_artifact(
         ArtifactCreateRequest(
             tenant_id=identity.tenant_id,
@@ -255,9 +255,8 @@ class DelayedRepository:
         _ = request
         return SimpleNamespace(id=self.run_id)
 
-    async def append_step(self, request) -> SimpleNamespace:
-        _ = request
-        return SimpleNamespace(id=uuid.uuid4())
+    async def append_steps(self, requests) -> list[SimpleNamespace]:
+        return [SimpleNamespace(id=uuid.uuid4()) for _ in requests]
 
     async def update_run_status(self, **kwargs) -> SimpleNamespace:
         _ = kwargs
@@ -4,6 +4,7 @@ import asyncio
 
 from agent_framework import Workflow
 
+from fleet_rlm.agent_host.adapters import iter_workspace_host_queue
 from fleet_rlm.agent_host.app import stream_hosted_workspace_task
 from fleet_rlm.agent_host.workflow import build_workspace_host_workflow
 from fleet_rlm.agent_host.sessions import OrchestrationSessionContext
@@ -34,6 +35,28 @@ def test_build_workspace_host_workflow_returns_agent_framework_workflow() -> Non
     assert isinstance(build_workspace_host_workflow(), Workflow)
 
 
+def test_iter_workspace_host_queue_merges_queued_tokens_only() -> None:
+    async def scenario() -> list[tuple[str, str]]:
+        queue: asyncio.Queue[WorkspaceEvent | None] = asyncio.Queue()
+        for item in (
+            WorkspaceEvent(kind="assistant_token", text="Hel"),
+            WorkspaceEvent(kind="assistant_token", text="lo"),
+            WorkspaceEvent(kind="status", text="thinking"),
+            WorkspaceEvent(kind="assistant_token", text=" there"),
+            None,
+        ):
+            queue.put_nowait(item)
+        return [
+            (event.kind, event.text) async for event in iter_workspace_host_queue(queue)
+        ]
+
+    assert asyncio.run(scenario()) == [
+        ("assistant_token", "Hello"),
+        ("status", "thinking"),
+        ("assistant_token", " there"),
+    ]
+
+
 def test_stream_hosted_workspace_task_applies_host_owned_hitl_policy(
     monkeypatch,
 ) -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 
 import pytest
 
@@ -29,6 +30,11 @@ class _FakeWebSocket:
             raise RuntimeError("send failed")
         self.sent.append(payload)
 
+    async def send_text(self, data: str) -> None:
+        if self.fail_on_send:
+            raise RuntimeError("send failed")
+        self.sent.append(json.loads(data))
+
 
 def test_sanitize_event_payload_redacts_and_truncates():
     payload = {
@@ -66,6 +72,12 @@ def test_sanitize_event_payload_honors_collection_limit(
 
     sanitized = sanitize_event_payload([1, 2, 3, 4])
     assert sanitized[-1] == "<truncated:2>"
+    assert sanitize_event_payload((1, 2, 3)) == [1, 2, "<truncated:1>"]
+    assert sanitize_event_payload({"a": 1, "b": 2, "c": 3, "d": 4}) == {
+        "a": 1,
+        "b": 2,
+        "__truncated__": 2,
+    }
 
 
 def test_sanitize_event_payload_invalid_env_uses_defaults(
@@ -111,7 +123,7 @@ async def test_execution_event_emitter_filters_by_subscription():
     await asyncio.sleep(0.01)
 
     assert ws_match.accepted is True
-    assert len(ws_match.sent) == 1
+    assert ws_match.sent == [event.model_dump(mode="json")]
     assert ws_other.accepted is True
     assert ws_other.sent == []
     await emitter.disconnect(ws_match)  # type: ignore[arg-type]
@@ -118,3 +118,23 @@ def test_apply_env_updates_ignores_masked_secret_round_trip_values(
     assert "DAYTONA_API_KEY=daytonasecret99" in text
     assert "DSPY_LM_MODEL='openai/gpt-4.1-mini'" in text
     assert result["updated"] == ["DSPY_LM_MODEL"]
+
+
+def test_get_settings_snapshot_sees_env_file_updates(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    env_path = write_env_file(tmp_path, lines=["DSPY_LM_MODEL=openai/gpt-4.1"])
+    clear_env(monkeypatch, "DSPY_LM_MODEL")
+
+    first = get_settings_snapshot(keys=["DSPY_LM_MODEL"], env_path=env_path)
+    apply_env_updates(
+        updates={"DSPY_LM_MODEL": "openai/gpt-4.1-mini"}, env_path=env_path
+    )
+    second = get_settings_snapshot(keys=["DSPY_LM_MODEL"], env_path=env_path)
+    env_path.unlink()
+    third = get_settings_snapshot(keys=["DSPY_LM_MODEL"], env_path=env_path)
+
+    assert first["values"]["DSPY_LM_MODEL"] == "openai/gpt-4.1"
+    assert second["values"]["DSPY_LM_MODEL"] == "openai/gpt-4.1-mini"
+    assert third["values"]["DSPY_LM_MODEL"] == "openai/gpt-4.1-mini"
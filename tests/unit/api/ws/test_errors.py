@@ -6,25 +6,18 @@ from typing import Any, cast
 from fleet_rlm.api.routers.ws.errors import handle_stream_error
 from fleet_rlm.integrations.database import RunStatus
 from fleet_rlm.worker import WorkspaceEvent
+from tests.unit.fixtures_ws import RecordingWebSocket
 
 
 class _ClosedSendWebSocket:
-    async def send_json(self, payload: Any) -> None:
-        _ = payload
+    async def send_text(self, text: str) -> None:
+        _ = text
         raise RuntimeError(
             "Unexpected ASGI message 'websocket.send', after sending "
             "'websocket.close' or response already completed."
         )
 
 
-class _RecordingWebSocket:
-    def __init__(self) -> None:
-        self.sent: list[dict[str, Any]] = []
-
-    async def send_json(self, payload: dict[str, Any]) -> None:
-        self.sent.append(payload)
-
-
 class _LifecycleStub:
     def __init__(self) -> None:
         self.run_id = "test-run"
@@ -81,7 +74,7 @@ def test_handle_stream_error_ignores_closed_socket_during_error_send() -> None:
 
 def test_handle_stream_error_completes_run_with_error_summary() -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         lifecycle = _LifecycleStub()
 
         await handle_stream_error(
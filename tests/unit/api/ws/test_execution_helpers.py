@@ -25,11 +25,12 @@ from fleet_rlm.api.routers.ws.session import (
 )
 from fleet_rlm.api.schemas import WSMessage
 from tests.ui.fixtures_ui import FakeChatAgent, ts
+from tests.unit.fixtures_ws import RecordingWebSocket
 
 
 class _ClosedSendWebSocket:
-    async def send_json(self, payload: Any) -> None:
-        _ = payload
+    async def send_text(self, text: str) -> None:
+        _ = text
         raise RuntimeError(
             "Unexpected ASGI message 'websocket.send', after sending "
             "'websocket.close' or response already completed."
@@ -46,19 +47,11 @@ class _ClosedCloseWebSocket:
 
 
 class _DisconnectingWebSocket:
-    async def send_json(self, payload: Any) -> None:
-        _ = payload
+    async def send_text(self, text: str) -> None:
+        _ = text
         raise WebSocketDisconnect(code=1001)
 
 
-class _RecordingWebSocket:
-    def __init__(self) -> None:
-        self.sent: list[dict[str, Any]] = []
-
-    async def send_json(self, payload: dict[str, Any]) -> None:
-        self.sent.append(payload)
-
-
 class _LifecycleStub:
     def __init__(self) -> None:
         self.run_id = "test-run"
@@ -166,7 +159,7 @@ def test_emit_stream_event_translates_closed_send_runtime_error_to_disconnect()
 
 def test_emit_stream_event_sends_terminal_error_before_run_completion() -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         lifecycle = _HangingTerminalLifecycle()
         task = asyncio.create_task(
             _emit_stream_event(
@@ -246,7 +239,7 @@ def test_emit_stream_event_persists_terminal_cancelled_and_error_events(
     expected_include_volume_save: bool,
 ) -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         lifecycle = _HangingTerminalLifecycle()
         persist_calls: list[bool] = []
 
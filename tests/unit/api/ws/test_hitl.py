@@ -4,14 +4,7 @@ import asyncio
 from typing import Any
 
 from fleet_rlm.api.routers.ws.hitl import handle_resolve_hitl
-
-
-class _WebSocketStub:
-    def __init__(self) -> None:
-        self.messages: list[dict[str, Any]] = []
-
-    async def send_json(self, payload: dict[str, Any]) -> None:
-        self.messages.append(payload)
+from tests.unit.fixtures_ws import RecordingWebSocket
 
 
 def _command_response(*, command: str, result: dict[str, Any]) -> dict[str, Any]:
@@ -20,7 +13,7 @@ def _command_response(*, command: str, result: dict[str, Any]) -> dict[str, Any]
 
 def test_handle_resolve_hitl_emits_event_and_command_result() -> None:
     async def scenario() -> None:
-        websocket = _WebSocketStub()
+        websocket = RecordingWebSocket()
 
         handled = await handle_resolve_hitl(
             websocket=websocket,
@@ -45,17 +38,17 @@ def test_handle_resolve_hitl_emits_event_and_command_result() -> None:
         )
 
         assert handled is True
-        assert websocket.messages[0]["type"] == "event"
-        assert websocket.messages[0]["data"]["kind"] == "hitl_resolved"
-        assert websocket.messages[1]["type"] == "command_result"
-        assert websocket.messages[1]["result"]["resolution"] == "Approve"
+        assert websocket.sent[0]["type"] == "event"
+        assert websocket.sent[0]["data"]["kind"] == "hitl_resolved"
+        assert websocket.sent[1]["type"] == "command_result"
+        assert websocket.sent[1]["result"]["resolution"] == "Approve"
 
     asyncio.run(scenario())
 
 
 def test_handle_resolve_hitl_rejects_missing_args() -> None:
     async def scenario() -> None:
-        websocket = _WebSocketStub()
+        websocket = RecordingWebSocket()
 
         handled = await handle_resolve_hitl(
             websocket=websocket,
@@ -66,7 +59,7 @@ def test_handle_resolve_hitl_rejects_missing_args() -> None:
         )
 
         assert handled is True
-        assert websocket.messages == [
+        assert websocket.sent == [
             {
                 "type": "command_result",
                 "command": "resolve_hitl",
@@ -83,7 +76,7 @@ def test_handle_resolve_hitl_rejects_missing_args() -> None:
 
 def test_handle_resolve_hitl_ignores_other_commands() -> None:
     async def scenario() -> None:
-        websocket = _WebSocketStub()
+        websocket = RecordingWebSocket()
 
         handled = await handle_resolve_hitl(
             websocket=websocket,
@@ -94,6 +87,6 @@ def test_handle_resolve_hitl_ignores_other_commands() -> None:
         )
 
         assert handled is False
-        assert websocket.messages == []
+        assert websocket.sent == []
 
     asyncio.run(scenario())
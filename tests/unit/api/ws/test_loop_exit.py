@@ -9,14 +9,7 @@ from fleet_rlm.api.routers.ws.loop_exit import (
     handle_chat_loop_exception,
 )
 from fleet_rlm.integrations.database import RunStatus
-
-
-class _RecordingWebSocket:
-    def __init__(self) -> None:
-        self.sent: list[dict[str, Any]] = []
-
-    async def send_json(self, payload: dict[str, Any]) -> None:
-        self.sent.append(payload)
+from tests.unit.fixtures_ws import RecordingWebSocket
 
 
 class _LifecycleStub:
@@ -100,7 +93,7 @@ def test_handle_chat_disconnect_marks_failed_when_persist_required() -> None:
 
 def test_handle_chat_loop_exception_sends_error_and_completes_failed() -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         lifecycle = _LifecycleStub()
         persist_calls: list[bool] = []
 
@@ -128,7 +121,7 @@ def test_handle_chat_loop_exception_sends_error_and_completes_failed() -> None:
 
 def test_handle_chat_loop_exception_tolerates_persist_required_error() -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         lifecycle = _LifecycleStub()
 
         async def local_persist(*, include_volume_save: bool = True) -> None:
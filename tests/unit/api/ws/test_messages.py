@@ -2,25 +2,17 @@ from __future__ import annotations
 
 import asyncio
 import uuid
-from typing import Any
 
 from fleet_rlm.api.routers.ws.messages import (
     parse_ws_message_or_send_error,
     resolve_session_identity,
 )
 from fleet_rlm.api.schemas import WSMessage
-
-
-class _RecordingWebSocket:
-    def __init__(self) -> None:
-        self.sent: list[dict[str, Any]] = []
-
-    async def send_json(self, payload: dict[str, Any]) -> None:
-        self.sent.append(payload)
+from tests.unit.fixtures_ws import RecordingWebSocket
 
 
 def test_parse_ws_message_or_send_error_returns_valid_message() -> None:
-    websocket = _RecordingWebSocket()
+    websocket = RecordingWebSocket()
 
     message = asyncio.run(
         parse_ws_message_or_send_error(
@@ -34,7 +26,7 @@ def test_parse_ws_message_or_send_error_returns_valid_message() -> None:
 
 
 def test_parse_ws_message_or_send_error_reports_unknown_type() -> None:
-    websocket = _RecordingWebSocket()
+    websocket = RecordingWebSocket()
 
     message = asyncio.run(
         parse_ws_message_or_send_error(
@@ -53,7 +45,7 @@ def test_parse_ws_message_or_send_error_reports_unknown_type() -> None:
 
 
 def test_parse_ws_message_or_send_error_reports_daytona_repo_ref_contract() -> None:
-    websocket = _RecordingWebSocket()
+    websocket = RecordingWebSocket()
 
     message = asyncio.run(
         parse_ws_message_or_send_error(
@@ -133,11 +133,13 @@ def test_complete_run_drains_batched_steps_before_shutdown() -> None:
     class _RecordingRepository:
         def __init__(self) -> None:
             self.step_requests: list[Any] = []
+            self.batches: list[int] = []
             self.status_updates: list[dict[str, Any]] = []
 
-        async def append_step(self, request: Any) -> Any:
-            self.step_requests.append(request)
-            return SimpleNamespace(id=len(self.step_requests))
+        async def append_steps(self, requests: list[Any]) -> list[Any]:
+            self.batches.append(len(requests))
+            self.step_requests.extend(requests)
+            return [SimpleNamespace(id=request.step_index) for request in requests]
 
         async def update_run_status(
             self,
@@ -205,6 +207,7 @@ def test_complete_run_drains_batched_steps_before_shutdown() -> None:
 
         assert [request.step_index for request in repository.step_requests] == [1, 2]
         assert [request.run_id for request in repository.step_requests] == [7, 7]
+        assert repository.batches == [2]
         assert lifecycle._persist_worker_task is None
         assert lifecycle._persist_queue is None
         assert repository.status_updates == [
@@ -218,3 +221,56 @@ def test_complete_run_drains_batched_steps_before_shutdown() -> None:
         assert emitter.events[-1].type == "execution_completed"
 
     asyncio.run(scenario())
+
+
+def test_persist_worker_replays_failed_batch_one_step_at_a_time() -> None:
+    class _FlakyRepository:
+        def __init__(self) -> None:
+            self.persisted: list[int] = []
+
+        async def append_steps(self, requests: list[Any]) -> list[Any]:
+            raise RuntimeError("batch rolled back")
+
+        async def append_step(self, request: Any) -> Any:
+            if request.step_index == 2:
+                raise RuntimeError("bad step")
+            self.persisted.append(request.step_index)
+            return SimpleNamespace(id=request.step_index)
+
+    async def scenario() -> None:
+        repository = _FlakyRepository()
+        session_record: dict[str, Any] = {}
+        lifecycle = ws_persistence.ExecutionLifecycleManager(
+            run_id="run-1",
+            workspace_id="workspace-1",
+            user_id="user-1",
+            session_id="session-1",
+            execution_emitter=SimpleNamespace(),
+            step_builder=SimpleNamespace(),
+            repository=repository,
+            identity_rows=SimpleNamespace(tenant_id="tenant-1"),
+            active_run_db_id=7,
+            strict_persistence=False,
+            session_record=session_record,
+        )
+        lifecycle._persist_queue = asyncio.Queue(maxsize=512)
+        for index in (1, 2, 3):
+            await lifecycle._persist_queue.put(
+                ExecutionStep(
+                    id=f"step-{index}",
+                    type="tool",
+                    label=f"step {index}",
+                    timestamp=float(index),
+                )
+            )
+        await lifecycle._persist_queue.put(None)
+
+        await asyncio.wait_for(lifecycle._persist_worker(), timeout=1.0)
+
+        assert repository.persisted == [1, 3]
+        assert isinstance(lifecycle._persistence_error, RuntimeError)
+        assert str(lifecycle._persistence_error) == "bad step"
+        assert lifecycle._last_step_db_id == 3
+        assert session_record["last_step_db_id"] == "3"
+
+    asyncio.run(scenario())
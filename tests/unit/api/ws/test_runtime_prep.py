@@ -10,16 +10,14 @@ from fleet_rlm.api.runtime_services.chat_runtime import (
     build_chat_agent_context as _build_chat_agent_context,
     new_chat_session_state as _new_chat_session_state,
 )
+from tests.unit.fixtures_ws import RecordingWebSocket
 
 
-class _RecordingWebSocket:
+class _RecordingWebSocket(RecordingWebSocket):
     def __init__(self) -> None:
-        self.sent: list[dict[str, Any]] = []
+        super().__init__()
         self.closed_code: int | None = None
 
-    async def send_json(self, payload: dict[str, Any]) -> None:
-        self.sent.append(payload)
-
     async def close(self, code: int = 1000) -> None:
         self.closed_code = code
 
@@ -9,14 +9,7 @@ import fleet_rlm.agent_host.terminal_flow as terminal_flow
 from fleet_rlm.agent_host.sessions import OrchestrationSessionContext
 from fleet_rlm.worker import WorkspaceEvent
 from tests.ui.fixtures_ui import ts
-
-
-class _RecordingWebSocket:
-    def __init__(self) -> None:
-        self.sent: list[dict[str, Any]] = []
-
-    async def send_json(self, payload: dict[str, Any]) -> None:
-        self.sent.append(payload)
+from tests.unit.fixtures_ws import RecordingWebSocket
 
 
 class _LifecycleStub:
@@ -74,7 +67,7 @@ def test_build_stream_event_dict_serializes_core_fields() -> None:
 
 def test_handle_terminal_stream_event_final_completes_and_sends() -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         lifecycle = _LifecycleStub()
         persist_calls: list[bool] = []
         event = WorkspaceEvent(kind="final", text="done", timestamp=ts(), terminal=True)
@@ -105,7 +98,7 @@ def test_handle_terminal_stream_event_final_completes_and_sends() -> None:
 
 def test_handle_terminal_stream_event_final_still_sends_when_persist_fails() -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         lifecycle = _LifecycleStub()
         event = WorkspaceEvent(kind="final", text="done", timestamp=ts(), terminal=True)
 
@@ -135,7 +128,7 @@ def test_handle_terminal_stream_event_final_still_sends_when_persist_fails() ->
 
 def test_handle_terminal_stream_event_error_sends_before_completion() -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         lifecycle = _HangingLifecycle()
         event = WorkspaceEvent(kind="error", text="boom", timestamp=ts(), terminal=True)
 
@@ -172,7 +165,7 @@ def test_handle_terminal_stream_event_error_sends_before_completion() -> None:
 
 def test_handle_terminal_stream_event_final_tool_error_marks_run_failed() -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         lifecycle = _LifecycleStub()
         event = WorkspaceEvent(
             kind="final",
@@ -213,7 +206,7 @@ def test_handle_terminal_stream_event_delegates_to_terminal_flow(
     monkeypatch,
 ) -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         lifecycle = _LifecycleStub()
         event = WorkspaceEvent(kind="final", text="done", timestamp=ts(), terminal=True)
         session = OrchestrationSessionContext(
@@ -13,19 +13,12 @@ from fleet_rlm.api.routers.ws.turn_setup import prepare_chat_message_turn
 from fleet_rlm.api.routers.ws.worker_request import build_workspace_task_request
 from fleet_rlm.api.schemas import WSMessage
 from tests.ui.fixtures_ui import FakeChatAgent
-
-
-class _RecordingWebSocket:
-    def __init__(self) -> None:
-        self.sent: list[dict[str, Any]] = []
-
-    async def send_json(self, payload: dict[str, Any]) -> None:
-        self.sent.append(payload)
+from tests.unit.fixtures_ws import RecordingWebSocket
 
 
 def test_prepare_chat_message_turn_rejects_empty_content() -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         session = _ChatSessionState(
             canonical_workspace_id="workspace",
             canonical_user_id="user",
@@ -72,7 +65,7 @@ def test_prepare_chat_message_turn_rejects_empty_content() -> None:
 
 def test_prepare_chat_message_turn_initializes_daytona_turn(monkeypatch) -> None:
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         agent = FakeChatAgent()
         session = _ChatSessionState(
             canonical_workspace_id="workspace",
@@ -184,7 +177,7 @@ def test_build_workspace_task_request_uses_prepared_turn_inputs() -> None:
         return SimpleNamespace(), object(), "run-123", uuid.uuid4()
 
     async def scenario() -> None:
-        websocket = _RecordingWebSocket()
+        websocket = RecordingWebSocket()
         agent = FakeChatAgent()
         session = _ChatSessionState(
             canonical_workspace_id="workspace",
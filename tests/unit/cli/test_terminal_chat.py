@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from types import SimpleNamespace
 
 from prompt_toolkit.document import Document
 
-from fleet_rlm.cli.terminal.commands import _coerce_value, _parse_command_payload
+from fleet_rlm.cli.terminal.chat import _TerminalChatSession
+from fleet_rlm.cli.terminal.commands import (
+    _coerce_value,
+    _parse_command_payload,
+    handle_slash_command,
+)
+from fleet_rlm.cli.terminal.session_view import append_transcript
 from fleet_rlm.cli.terminal.settings import _write_env_updates
-from fleet_rlm.cli.terminal.ui import _FleetCompleter, _iter_mention_paths
+from fleet_rlm.cli.terminal.ui import (
+    _FleetCompleter,
+    _iter_mention_paths,
+    _visible_transcript,
+)
+from fleet_rlm.runtime.models import StreamEvent
 
 
 def test_coerce_value_basic_types() -> None:
@@ -30,6 +43,11 @@ def test_parse_command_payload_from_key_values() -> None:
     assert payload == {"path": "README.md", "size": 20, "append": True}
 
 
+def test_parse_command_payload_keeps_quoted_values() -> None:
+    payload = _parse_command_payload("query='find auth flows' max_chunks=24")
+    assert payload == {"query": "find auth flows", "max_chunks": 24}
+
+
 def test_iter_mention_paths_lists_matching_entries(tmp_path: Path, monkeypatch) -> None:
     (tmp_path / "README.md").write_text("ok")
     (tmp_path / "src").mkdir()
@@ -81,3 +99,89 @@ def test_write_env_updates_persists_values(tmp_path: Path, monkeypatch) -> None:
     content = env_path.read_text()
     assert "DSPY_LM_MODEL=" in content
     assert "openai/gpt-4o-mini" in content
+
+
+def test_session_runs_turns_on_one_loop_and_cancels_leftovers() -> None:
+    session = SimpleNamespace(_loop=None)
+    leftovers: list[asyncio.Task[None]] = []
+
+    async def turn() -> asyncio.AbstractEventLoop:
+        leftovers.append(asyncio.create_task(asyncio.sleep(60)))
+        return asyncio.get_running_loop()
+
+    first = _TerminalChatSession._run_async(session, turn())
+    second = _TerminalChatSession._run_async(session, turn())
+
+    assert first is second
+    assert all(task.cancelled() for task in leftovers)
+
+    with _TerminalChatSession._session_loop(session):
+        pass
+    assert session._loop is None
+    assert first.is_closed()
+
+
+def test_append_transcript_trims_in_batches_and_keeps_latest() -> None:
+    session = SimpleNamespace(transcript=[])
+    transcript = session.transcript
+    for index in range(251):
+        append_transcript(session, "you", f"message {index}")
+
+    assert session.transcript is transcript
+    assert len(transcript) == 200
+    assert transcript[-1] == ("you", "message 250")
+    assert transcript[0] == ("you", "message 51")
+
+
+def test_visible_transcript_keeps_newest_entries_within_rows() -> None:
+    long_result = "\n".join(f"line {idx}" for idx in range(100))
+    transcript = [("you", "hi"), ("result", long_result), ("assistant", "done")]
+
+    visible = _visible_transcript(transcript, width=40, rows=6)
+
+    assert visible[-1] == ("assistant", "done")
+    assert visible[0] == ("result", "line 97\nline 98\nline 99")
+    assert all(role != "you" for role, _ in visible)
+
+
+def test_handle_slash_command_dispatches_session_actions() -> None:
+    printed: list[str] = []
+    session = SimpleNamespace(
+        console=SimpleNamespace(print=printed.append),
+        trace_mode="compact",
+    )
+
+    assert handle_slash_command(session, agent=None, line="/trace verbose") is False
+    assert session.trace_mode == "verbose"
+    assert handle_slash_command(session, agent=None, line="/quit") is True
+    assert printed[-1] == "[dim]bye[/dim]"
+
+
+def test_run_chat_turn_merges_streamed_reasoning_into_one_entry() -> None:
+    class _Agent:
+        async def aiter_chat_turn_stream(self, *, message: str, trace: bool):
+            assert trace is True
+            for chunk in ("Look", "ing at", " files"):
+                yield StreamEvent(kind="reasoning_step", text=chunk)
+            yield StreamEvent(kind="tool_call", text="list_files")
+            yield StreamEvent(kind="reasoning_step", text="Done")
+            yield StreamEvent(kind="final", text="answer")
+
+    session = object.__new__(_TerminalChatSession)
+    session.transcript = []
+    session.trace_mode = "verbose"
+    renders: list[str] = []
+    session._render_shell = lambda *, draft_assistant="": renders.append(
+        draft_assistant
+    )
+    session._print_warning = lambda message: None
+
+    asyncio.run(session._run_chat_turn(_Agent(), "hi"))
+
+    assert session.transcript == [
+        ("you", "hi"),
+        ("thinking", "Looking at files"),
+        ("tool", "-> list_files"),
+        ("thinking", "Done"),
+        ("assistant", "answer"),
+    ]
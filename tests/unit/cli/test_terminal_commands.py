@@ -212,3 +212,20 @@ def test_terminal_command_palette_no_longer_advertises_analyze() -> None:
 
     assert "/analyze" not in command_names
     assert _COMMAND_TEMPLATES["/run-long-context"].endswith("summarize")
+
+
+@pytest.mark.parametrize(
+    "arg_text",
+    [
+        "",
+        "   ",
+        "alpha beta",
+        " alpha\tbeta\r\ngamma ",
+        "name with unicode spaces",
+        "tail\x0bvertical\x0cfeed",
+    ],
+)
+def test_safe_split_matches_shlex_without_quotes(arg_text: str) -> None:
+    import shlex
+
+    assert commands._safe_split(arg_text) == shlex.split(arg_text)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+class RecordingWebSocket:
+    """Fake websocket that records every decoded JSON payload on ``sent``.
+
+    The websocket helpers send pre-encoded JSON via ``send_text``; command
+    handlers still call ``send_json`` directly, so both land in ``sent``.
+    """
+
+    def __init__(self) -> None:
+        self.sent: list[Any] = []
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(json.loads(text))
+
+    async def send_json(self, payload: Any) -> None:
+        self.sent.append(payload)
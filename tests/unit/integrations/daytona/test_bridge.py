@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
+import time
 from types import SimpleNamespace
 
+import httpx
 import pytest
 
 from dspy.primitives import CodeInterpreterError
@@ -122,3 +127,138 @@ async def test_daytona_bridge_resets_state_after_all_retries_fail(
     assert bridge._broker_session_id is None
     # Both created sessions should be deleted (one per attempt).
     assert len(sandbox.process.deleted_sessions) == 2
+
+
+@pytest.mark.asyncio
+async def test_daytona_bridge_posts_structured_results_without_double_encoding() -> (
+    None
+):
+    bridge = DaytonaToolBridge(sandbox=_FakeSandbox(), context=object())
+    bridge._broker_url = "https://preview.daytona.test/3000"
+    bridge._broker_token = "tok"
+    posted: list[dict[str, object]] = []
+    seen_tokens: set[str | None] = set()
+    pending_batches = [
+        [{"id": "call-1", "tool_name": "count", "args": [], "kwargs": {}}],
+    ]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_tokens.add(request.headers.get("x-daytona-preview-token"))
+        if request.method == "POST":
+            posted.append(json.loads(request.content))
+            return httpx.Response(200, json={"status": "ok"})
+        batch = pending_batches.pop(0) if pending_batches else []
+        return httpx.Response(200, json={"requests": batch})
+
+    bridge._http_client = httpx.Client(transport=httpx.MockTransport(_handler))
+
+    async def _code() -> None:
+        while not posted:
+            await asyncio.sleep(0.01)
+
+    code_task = asyncio.create_task(_code())
+    callback_count = await bridge._apoll_and_execute_tools(
+        code_task=code_task,
+        tool_executor=lambda name, args, kwargs: {"count": 2},
+    )
+    client = bridge._http_client
+    await bridge.aclose()
+
+    assert callback_count == 1
+    assert posted == [{"result": {"count": 2}, "claim_token": ""}]
+    assert seen_tokens == {"tok"}
+    assert client.is_closed
+    assert bridge._http_client is None
+
+
+@pytest.mark.asyncio
+async def test_daytona_bridge_skips_pending_polls_while_at_capacity() -> None:
+    bridge = DaytonaToolBridge(
+        sandbox=_FakeSandbox(),
+        context=object(),
+        max_concurrent_tool_calls=1,
+    )
+    bridge._broker_url = "https://preview.daytona.test/3000"
+    bridge._broker_token = "tok"
+    posted: list[dict[str, object]] = []
+    polls_while_busy: list[int] = []
+    tool_started = threading.Event()
+    release_tool = threading.Event()
+    pending_batches = [
+        [{"id": "call-1", "tool_name": "slow", "args": [], "kwargs": {}}],
+    ]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            posted.append(json.loads(request.content))
+            return httpx.Response(200, json={"status": "ok"})
+        if tool_started.is_set() and not release_tool.is_set():
+            polls_while_busy.append(1)
+        batch = pending_batches.pop(0) if pending_batches else []
+        return httpx.Response(200, json={"requests": batch})
+
+    bridge._http_client = httpx.Client(transport=httpx.MockTransport(_handler))
+
+    def _slow_tool(name, args, kwargs):
+        tool_started.set()
+        release_tool.wait(timeout=5)
+        return {"ok": True}
+
+    async def _code() -> None:
+        while not tool_started.is_set():
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        release_tool.set()
+        while not posted:
+            await asyncio.sleep(0.01)
+
+    code_task = asyncio.create_task(_code())
+    callback_count = await bridge._apoll_and_execute_tools(
+        code_task=code_task,
+        tool_executor=_slow_tool,
+    )
+    await bridge.aclose()
+
+    assert callback_count == 1
+    assert posted == [{"result": {"ok": True}, "claim_token": ""}]
+    assert polls_while_busy == []
+
+
+def test_broker_server_hands_result_to_waiting_tool_call() -> None:
+    pytest.importorskip("flask")
+
+    from fleet_rlm.integrations.daytona.bridge import _BROKER_SERVER_CODE
+
+    namespace: dict[str, object] = {"__name__": "broker_server"}
+    exec(_BROKER_SERVER_CODE, namespace)
+    app = namespace["app"]
+    responses: list[object] = []
+
+    def _call_tool() -> None:
+        with app.test_client() as client:
+            responses.append(
+                client.post(
+                    "/tool_call", json={"id": "call-1", "tool_name": "add"}
+                ).get_json()
+            )
+
+    caller = threading.Thread(target=_call_tool)
+    caller.start()
+    with app.test_client() as client:
+        pending: list[dict[str, object]] = []
+        deadline = time.monotonic() + 5
+        while not pending:
+            assert time.monotonic() < deadline, "tool call never became pending"
+            pending = client.get("/pending").get_json()["requests"]
+            if not pending:
+                time.sleep(0.01)
+        claim_token = pending[0]["claim_token"]
+        posted = client.post(
+            "/result/call-1", json={"result": 5, "claim_token": claim_token}
+        )
+    caller.join(timeout=5)
+
+    assert posted.status_code == 200
+    assert responses == [{"result": 5}]
+    assert namespace["_result_ready"] == {}
+    assert namespace["_pending_requests"] == {}
@@ -343,6 +343,37 @@ def test_daytona_interpreter_uses_bridge_for_llm_queries(monkeypatch) -> None:
     assert "llm_query" in captured["tools"]
 
 
+def test_daytona_interpreter_safe_variables_keeps_json_values_and_stringifies_rest() -> (
+    None
+):
+    interpreter = DaytonaInterpreter(runtime=_FakeRuntime())
+    marker = object()
+
+    safe_vars = interpreter.safe_variables(
+        {"text": "hi", 3: 1.5, "flag": None, "rows": [{"a": 1}], "obj": marker}
+    )
+
+    assert safe_vars == {
+        "text": "hi",
+        "3": 1.5,
+        "flag": None,
+        "rows": [{"a": 1}],
+        "obj": str(marker),
+    }
+
+
+def test_daytona_interpreter_owns_sub_lm_executor_between_start_and_shutdown() -> None:
+    interpreter = DaytonaInterpreter(runtime=_FakeRuntime())
+
+    interpreter.start()
+    executor = interpreter._sub_lm_executor
+    assert executor is not None
+
+    interpreter.shutdown()
+    assert interpreter._sub_lm_executor is None
+    assert executor._shutdown
+
+
 def test_daytona_interpreter_exports_context_id_for_resume() -> None:
     runtime = _FakeRuntime()
     interpreter = DaytonaInterpreter(runtime=runtime)
@@ -607,6 +638,36 @@ def test_bridge_tools_falls_back_to_interpreter_llm_query() -> None:
     assert bridge["llm_query_batched"] == interpreter.llm_query_batched
 
 
+def test_bridge_tools_cache_invalidates_on_tool_updates() -> None:
+    runtime = _FakeRuntime()
+    interpreter = DaytonaInterpreter(runtime=runtime)
+
+    first = interpreter._bridge_tools()
+    assert interpreter._bridge_tools() is first
+
+    # dspy.RLM mutates the tool map in place and clears ``_tools_registered``.
+    interpreter.tools.update({"custom_tool": lambda value: value})
+    interpreter._tools_registered = False
+    refreshed = interpreter._bridge_tools()
+    assert refreshed is not first
+    assert "custom_tool" in refreshed
+
+    interpreter.tools = {}
+    assert "custom_tool" not in interpreter._bridge_tools()
+
+
+def test_submit_signature_cache_invalidates_on_output_fields_update() -> None:
+    runtime = _FakeRuntime()
+    interpreter = DaytonaInterpreter(runtime=runtime)
+
+    assert interpreter.submit_signature() is None
+    interpreter.output_fields = [{"name": "answer", "type": "str"}]
+    assert interpreter.submit_signature() == (("answer", "str"),)
+    assert interpreter.submit_signature() is interpreter.submit_signature()
+    interpreter.output_fields = None
+    assert interpreter.submit_signature() is None
+
+
 def test_daytona_interpreter_shutdown_closes_owned_runtime() -> None:
     runtime = _FakeRuntime()
     runtime.closed = 0
@@ -695,3 +756,37 @@ def test_daytona_interpreter_build_delegate_child_reuses_parent_session() -> Non
     assert child._session is not None
     assert child._session.sandbox is parent_sandbox
     assert child._session.context_id is None
+
+
+def test_base_setup_code_is_rendered_once_per_workspace() -> None:
+    from fleet_rlm.integrations.daytona.interpreter_assets import _base_setup_code
+
+    first = _base_setup_code(workspace_path="/workspace/a", volume_mount_path="/m")
+    again = _base_setup_code(workspace_path="/workspace/a", volume_mount_path="/m")
+    other = _base_setup_code(workspace_path="/workspace/b", volume_mount_path="/m")
+
+    assert first is again
+    assert "REPO_PATH = '/workspace/b'" in other
+
+
+def test_base_setup_code_add_buffer_honors_maxlen(tmp_path, monkeypatch) -> None:
+    from fleet_rlm.integrations.daytona.interpreter_assets import _base_setup_code
+
+    monkeypatch.chdir(tmp_path)
+    namespace: dict[str, Any] = {}
+    exec(
+        _base_setup_code(
+            workspace_path=str(tmp_path / "repo"),
+            volume_mount_path=str(tmp_path / "memory"),
+        ),
+        namespace,
+    )
+
+    for index in range(5):
+        status = namespace["add_buffer"]("recent", index, maxlen=3)
+    namespace["add_buffer"]("all", "a")
+    namespace["add_buffer"]("all", "b")
+
+    assert status == {"status": "ok", "name": "recent", "count": 3}
+    assert namespace["get_buffer"]("recent") == [2, 3, 4]
+    assert namespace["get_buffer"]("all") == ["a", "b"]
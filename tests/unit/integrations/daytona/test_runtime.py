@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 import subprocess
 from types import SimpleNamespace
 
@@ -862,3 +862,56 @@ def test_runtime_create_sandbox_snapshot_returns_summary() -> None:
     assert result["name"] == "my-snapshot"
     assert result["sandbox_id"] == "sbx-123"
     assert result["status"] == "created"
+
+
+def test_stage_local_directory_creates_each_remote_parent_once(
+    tmp_path: Path,
+) -> None:
+    from fleet_rlm.integrations.daytona.workspace import _astage_local_directory
+
+    for name in ("a.md", "b.md", "c.md"):
+        (tmp_path / "docs" / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / "docs" / name).write_text(f"# {name}\n", encoding="utf-8")
+    (tmp_path / "top.md").write_text("# top\n", encoding="utf-8")
+    fs = _FakeFs()
+
+    source = asyncio.run(
+        _astage_local_directory(
+            fs=fs,
+            resolved_path=tmp_path,
+            staged_root=PurePosixPath("/ctx/01-dir"),
+            source_id="context-1",
+        )
+    )
+
+    assert source.file_count == 4
+    assert [path for path, _mode in fs.created] == [
+        "/ctx/01-dir/docs",
+        "/ctx/01-dir",
+    ]
+
+
+def test_stage_context_paths_creates_context_root_once(tmp_path: Path) -> None:
+    from fleet_rlm.integrations.daytona.workspace import _astage_context_paths
+
+    first = tmp_path / "one.md"
+    second = tmp_path / "two.md"
+    first.write_text("# one\n", encoding="utf-8")
+    second.write_text("# two\n", encoding="utf-8")
+    sandbox = SimpleNamespace(fs=_FakeFs())
+
+    sources = asyncio.run(
+        _astage_context_paths(
+            sandbox=sandbox,
+            workspace_path="/ws",
+            context_paths=[str(first), str(second)],
+        )
+    )
+
+    assert len(sources) == 2
+    assert "/ws/.fleet-rlm/context/manifest.json" in sandbox.fs.uploads
+    assert [path for path, _mode in sandbox.fs.created] == [
+        "/ws/.fleet-rlm/context",
+        "/ws/.fleet-rlm/context/01-one",
+        "/ws/.fleet-rlm/context/02-two",
+    ]
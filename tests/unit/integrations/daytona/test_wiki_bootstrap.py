@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import asynccontextmanager
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from types import SimpleNamespace
 
 import pytest
@@ -54,6 +54,25 @@ def _fake_tree() -> dict[str, list[object]]:
     }
 
 
+def test_ensure_relative_directory_creates_shared_parents_once() -> None:
+    fake_fs = _FakeFs({})
+    base = PurePosixPath("/home/daytona/memory/wiki")
+    created: set[PurePosixPath] = set()
+
+    async def _ensure_all() -> None:
+        for relative in wiki_bootstrap.WIKI_DIRECTORIES:
+            await wiki_bootstrap.aensure_relative_directory(
+                fake_fs, base_path=base, relative_path=relative, created=created
+            )
+
+    asyncio.run(_ensure_all())
+
+    created_paths = [path for path, _mode in fake_fs.create_calls]
+    assert len(created_paths) == len(set(created_paths))
+    assert created_paths.count(f"{base}/raw") == 1
+    assert f"{base}/raw/assets" in created_paths
+
+
 def test_validate_bootstrap_request_requires_confirmation_token() -> None:
     with pytest.raises(ValueError, match="confirm-reset"):
         wiki_bootstrap.validate_bootstrap_request(
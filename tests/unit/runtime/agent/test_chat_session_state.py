@@ -2,7 +2,11 @@ from types import SimpleNamespace
 
 import dspy
 
-from fleet_rlm.runtime.agent.chat_session_state import append_history
+from fleet_rlm.runtime.agent.chat_session_state import (
+    append_history,
+    history_messages,
+    history_turns,
+)
 
 
 def _agent(history_max_turns: int | None):
@@ -40,3 +44,19 @@ def test_append_history_summarizes_older_turns_when_cap_is_exceeded() -> None:
         {"user_request": "u3", "assistant_response": "a3"},
         {"user_request": "u4", "assistant_response": "a4"},
     ]
+
+
+def test_history_messages_limit_copies_only_the_tail() -> None:
+    messages = [
+        {"user_request": f"u{idx}", "assistant_response": ""} for idx in range(5)
+    ]
+    agent = SimpleNamespace(history=dspy.History(messages=messages))
+
+    tail = history_messages(agent, limit=2)
+
+    assert tail == messages[-2:]
+    tail.append({"user_request": "extra", "assistant_response": ""})
+    assert len(agent.history.messages) == 5
+    assert history_messages(agent, limit=0) == []
+    assert history_messages(agent) == messages
+    assert history_turns(agent) == 5
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from types import SimpleNamespace
 
 import dspy
 
+from fleet_rlm.runtime.agent import chat_turns
 from fleet_rlm.runtime.agent.chat_turns import (
     TurnDelegationState,
     TurnMetricsSnapshot,
     build_turn_payload,
     process_prediction_to_turn_result,
+    run_persistence_coroutine,
+    spawn_persistence_task,
+    submit_local_persistence,
 )
 
 
@@ -186,3 +193,59 @@ def test_build_turn_payload_marks_tool_errors_as_runtime_degraded() -> None:
 
     assert payload["runtime_degraded"] is True
     assert payload["runtime_failure_category"] == "tool_execution_error"
+
+
+def test_run_persistence_coroutine_shares_one_loop_across_threads() -> None:
+    loops: list[asyncio.AbstractEventLoop] = []
+    loop_threads: list[str] = []
+
+    async def _record_loop() -> None:
+        loops.append(asyncio.get_running_loop())
+        loop_threads.append(threading.current_thread().name)
+
+    run_persistence_coroutine(_record_loop())
+    worker = threading.Thread(target=lambda: run_persistence_coroutine(_record_loop()))
+    worker.start()
+    worker.join(timeout=5)
+
+    assert len(loops) == 2
+    assert loops[0] is loops[1]
+    assert loop_threads == ["fleet-persistence-loop"] * 2
+
+
+def test_spawn_persistence_task_holds_task_until_done() -> None:
+    finished: list[bool] = []
+
+    async def _write() -> None:
+        await asyncio.sleep(0)
+        finished.append(True)
+
+    async def scenario() -> None:
+        spawn_persistence_task(_write())
+        assert len(chat_turns._persistence_tasks) == 1
+        while chat_turns._persistence_tasks:
+            await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+
+    assert finished == [True]
+
+
+def test_submit_local_persistence_runs_writes_in_submission_order() -> None:
+    written: list[int] = []
+    threads: set[str] = set()
+
+    def _write(index: int) -> None:
+        # Earlier writes sleep longer, so any concurrency would reorder them.
+        time.sleep(0.002 * (5 - index))
+        threads.add(threading.current_thread().name)
+        written.append(index)
+
+    futures = [
+        submit_local_persistence(lambda index=index: _write(index))
+        for index in range(5)
+    ]
+    futures[-1].result(timeout=5)
+
+    assert written == [0, 1, 2, 3, 4]
+    assert len(threads) == 1
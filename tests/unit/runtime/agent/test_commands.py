@@ -265,6 +265,23 @@ def test_resolve_tool_supports_raw_callables():
     assert resolved(path="p", content="c", append=False)["status"] == "ok"
 
 
+def test_resolve_tool_sees_rebound_and_appended_tools():
+    agent = _FakeAgent()
+    _resolve_tool(agent, "write_to_file")
+
+    def first(**kwargs):
+        return "first"
+
+    def second(**kwargs):
+        return "second"
+
+    agent.react_tools = [SimpleNamespace(name="summarize_long_document", func=first)]
+    assert _resolve_tool(agent, "summarize_long_document") is first
+
+    agent.react_tools.append(SimpleNamespace(name="grounded_answer", func=second))
+    assert _resolve_tool(agent, "grounded_answer") is second
+
+
 def test_resolve_tool_falls_back_to_agent_method():
     agent = _FakeAgent()
     agent.react_tools = []
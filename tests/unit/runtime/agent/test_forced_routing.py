@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+
 import dspy
 import pytest
 
 from fleet_rlm.runtime.agent import RLMReActChatAgent
 from fleet_rlm.runtime.agent.forced_routing import (
     ForcedFinalPayloadInput,
+    aiter_forced_rlm_turn_stream,
     arun_forced_rlm_turn,
     forced_stream_final_payload,
     run_forced_rlm_turn,
 )
 from fleet_rlm.runtime.execution.streaming import StreamingContext
+from fleet_rlm.runtime.models.streaming import StreamEvent
 from tests.unit.fixtures_react import FakeInterpreter
 
 pytestmark = pytest.mark.usefixtures("react_records")
@@ -66,6 +70,64 @@ async def test_arun_forced_rlm_turn_invokes_recursive_runtime_handoff(
     assert captured["stream_event_callback"] is None
 
 
+@pytest.mark.asyncio
+async def test_aiter_forced_rlm_turn_stream_relays_burst_in_order(
+    monkeypatch,
+) -> None:
+    agent = RLMReActChatAgent(interpreter=FakeInterpreter(), execution_mode="rlm_only")
+
+    async def _fake_spawn(agent_obj, *, prompt, context, stream_event_callback):
+        _ = agent_obj, prompt, context
+        for idx in range(5):
+            await stream_event_callback(StreamEvent(kind="status", text=f"s{idx}"))
+        return {"answer": "forced stream response", "trajectory": {}}
+
+    monkeypatch.setattr(
+        "fleet_rlm.runtime.agent.forced_routing.spawn_delegate_sub_agent_async",
+        _fake_spawn,
+    )
+
+    events = [
+        event
+        async for event in aiter_forced_rlm_turn_stream(agent, message="deep task")
+    ]
+
+    relayed = [event.text for event in events if event.text.startswith("s")]
+    assert relayed == ["s0", "s1", "s2", "s3", "s4"]
+    assert events[-1].kind == "final"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cancel_check", [None, lambda: False])
+async def test_aiter_forced_rlm_turn_stream_ends_when_slow_delegate_finishes(
+    monkeypatch,
+    cancel_check,
+) -> None:
+    agent = RLMReActChatAgent(interpreter=FakeInterpreter(), execution_mode="rlm_only")
+
+    async def _fake_spawn(agent_obj, *, prompt, context, stream_event_callback):
+        _ = agent_obj, prompt, context
+        await asyncio.sleep(0.08)
+        await stream_event_callback(StreamEvent(kind="status", text="s-late"))
+        return {"answer": "slow response", "trajectory": {}}
+
+    monkeypatch.setattr(
+        "fleet_rlm.runtime.agent.forced_routing.spawn_delegate_sub_agent_async",
+        _fake_spawn,
+    )
+
+    events = [
+        event
+        async for event in aiter_forced_rlm_turn_stream(
+            agent, message="deep task", cancel_check=cancel_check
+        )
+    ]
+
+    assert [event.text for event in events if event.text == "s-late"] == ["s-late"]
+    assert events[-1].kind == "final"
+    assert events[-1].text == "slow response"
+
+
 def test_forced_stream_final_payload_reuses_canonical_turn_metadata() -> None:
     agent = RLMReActChatAgent(interpreter=FakeInterpreter(), execution_mode="rlm_only")
     agent.history = dspy.History(
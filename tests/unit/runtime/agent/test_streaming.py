@@ -499,6 +499,35 @@ def test_iter_chat_turn_stream_fallback_on_stream_exception(monkeypatch):
     assert len(agent.history.messages) == 1
 
 
+def test_iter_chat_turn_stream_does_not_rerun_after_partial_output(monkeypatch):
+    def _failing_streamify(*args, **kwargs):
+        def _stream(**stream_kwargs):
+            yield StreamResponse(
+                predict_name="react",
+                signature_field_name="assistant_response",
+                chunk="partial",
+                is_last_chunk=False,
+            )
+            raise RuntimeError("connection reset")
+
+        return _stream
+
+    monkeypatch.setattr(
+        "fleet_rlm.runtime.agent.chat_agent.dspy.streamify", _failing_streamify
+    )
+
+    agent = RLMReActChatAgent(interpreter=FakeInterpreter())
+    chat_turn = Mock(side_effect=AssertionError("turn must not be re-run"))
+    monkeypatch.setattr(agent, "chat_turn", chat_turn)
+
+    events = list(agent.iter_chat_turn_stream("hello", trace=False))
+
+    assert events[-1].kind == "error"
+    assert events[-1].payload["partial_response"] == "partial"
+    assert events[-1].payload["error_type"] == "RuntimeError"
+    chat_turn.assert_not_called()
+
+
 def test_iter_chat_turn_stream_includes_guardrail_warnings(monkeypatch):
     def _fake_streamify(*args, **kwargs):
         def _stream(**stream_kwargs):
@@ -674,6 +703,19 @@ def test_normalize_trajectory_handles_dict():
     assert result[1]["tool_name"] == "search"
 
 
+def test_normalize_trajectory_orders_interleaved_step_keys():
+    """Out-of-order step keys still produce one step per index, sorted."""
+    trajectory = {
+        "tool_name_2": "third",
+        "tool_name_0": "first",
+        "thought_2": "again",
+        "tool_name_1": "second",
+    }
+    result = _normalize_trajectory(trajectory)
+    assert [step["index"] for step in result] == [0, 1, 2]
+    assert [step["tool_name"] for step in result] == ["first", "second", "third"]
+
+
 def test_normalize_trajectory_handles_multiple_fields():
     """Test _normalize_trajectory with multiple fields per step."""
     trajectory = {
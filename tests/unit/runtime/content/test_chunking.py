@@ -42,6 +42,18 @@ class TestChunkBySize:
     def test_empty_text(self):
         assert chunk_by_size("") == []
 
+    def test_overlap_stops_at_first_chunk_reaching_end(self):
+        assert chunk_by_size("abcdefghij", size=4, overlap=1) == [
+            "abcd",
+            "defg",
+            "ghij",
+        ]
+        assert chunk_by_size("abcdefgh", size=4, overlap=2) == [
+            "abcd",
+            "cdef",
+            "efgh",
+        ]
+
     def test_text_shorter_than_size(self):
         assert chunk_by_size("abc", size=10) == ["abc"]
 
@@ -119,6 +119,34 @@ class TestGrepHelper:
         assert "b" in hit
         assert "d" in hit
 
+    def test_grep_reports_each_line_once_across_line_endings(self, monkeypatch):
+        msgs = _run_driver(
+            monkeypatch,
+            [
+                _cmd(
+                    'text = "foo foo\\r\\nbar\\rFOO\\n"\n'
+                    'hits = grep(text, "foo", context=1)\n'
+                    "SUBMIT(hits)"
+                )
+            ],
+        )
+        assert msgs[0]["final"]["output"] == ["foo foo\nbar", "bar\nFOO"]
+
+    def test_grep_handles_length_changing_casefolds(self):
+        from fleet_rlm.runtime.execution.sandbox_assets import grep
+
+        text = "Straße one\nplain two\nSTRASSE three"
+        assert grep(text, "two") == ["plain two"]
+        assert grep(text, "three") == ["STRASSE three"]
+        assert grep(text, "straße") == ["Straße one"]
+
+    def test_grep_matches_dotless_i_like_ignorecase_regex(self):
+        from fleet_rlm.runtime.execution.sandbox_assets import grep
+
+        assert grep("ıx", "I") == ["ıx"]
+        assert grep("Ix\nother", "ıX") == ["Ix"]
+        assert grep("İstanbul", "istanbul") == ["İstanbul"]
+
     def test_grep_no_match(self, monkeypatch):
         msgs = _run_driver(
             monkeypatch,
@@ -197,6 +225,16 @@ class TestChunkByHeadersHelper:
         # Should still return one chunk (the whole text)
         assert msgs[0]["final"]["output"] == 1
 
+    def test_sections_keep_offsets_and_split_header_from_body(self):
+        from fleet_rlm.runtime.execution.sandbox_assets import chunk_by_headers
+
+        assert chunk_by_headers("pre\n# A\nbody a\n## B\n# C") == [
+            {"header": "", "content": "pre", "start_pos": 0},
+            {"header": "# A", "content": "body a", "start_pos": 4},
+            {"header": "## B", "content": "", "start_pos": 15},
+            {"header": "# C", "content": "", "start_pos": 20},
+        ]
+
 
 # ---------------------------------------------------------------------------
 # chunk_by_timestamps
@@ -293,6 +331,21 @@ class TestBufferHelpers:
         )
         assert msgs[0]["final"]["output"] == ["a", "b"]
 
+    def test_bounded_buffer_keeps_latest_entries(self, monkeypatch):
+        msgs = _run_driver(
+            monkeypatch,
+            [
+                _cmd(
+                    "for i in range(5):\n"
+                    '    add_buffer("recent", i, maxlen=3)\n'
+                    'snapshot = get_buffer("recent")\n'
+                    "snapshot.append(99)\n"
+                    'SUBMIT([snapshot, get_buffer("recent")])'
+                )
+            ],
+        )
+        assert msgs[0]["final"]["output"] == [[2, 3, 4, 99], [2, 3, 4]]
+
     def test_get_missing_buffer(self, monkeypatch):
         msgs = _run_driver(
             monkeypatch, [_cmd('buf = get_buffer("nonexistent")\nSUBMIT(buf)')]
@@ -366,6 +419,19 @@ class TestVolumeHelpers:
         )
         assert "not found" in msgs[0]["final"]["output"].lower()
 
+    def test_write_recreates_parent_removed_after_first_write(self, tmp_path):
+        import shutil
+
+        from fleet_rlm.runtime.execution import sandbox_assets
+
+        target = tmp_path / "nested" / "out.txt"
+        sandbox_assets._write_text(str(target), "one", "w", str(tmp_path))
+        shutil.rmtree(tmp_path / "nested")
+        sandbox_assets._write_text(str(target), "two", "w", str(tmp_path))
+
+        assert sandbox_assets._read_text(str(target)) == "two"
+        assert "not found" in sandbox_assets._read_text(str(tmp_path))
+
 
 # ---------------------------------------------------------------------------
 # Workspace helpers
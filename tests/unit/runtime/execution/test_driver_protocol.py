@@ -6,6 +6,8 @@ import inspect
 import json
 import sys
 
+import pytest
+
 from fleet_rlm.runtime.execution.core_driver import sandbox_driver
 
 
@@ -57,6 +59,21 @@ def test_tool_call_roundtrip(monkeypatch):
     assert messages[1]["final"] == {"sum": 5}
 
 
+def test_tool_registration_survives_repeat_and_deletion(monkeypatch):
+    commands = [
+        {"code": "del add", "tool_names": ["add"]},
+        {"code": "SUBMIT(add(1, 2))", "tool_names": ["add"], "output_names": ["sum"]},
+    ]
+    lines = [json.dumps(commands[0]), json.dumps(commands[1])]
+    lines.append(json.dumps({"tool_result": 3}))
+
+    messages = _run_driver(monkeypatch, lines)
+
+    assert messages[0]["stderr"] == ""
+    assert messages[1]["tool_call"]["name"] == "add"
+    assert messages[2]["final"] == {"sum": 3}
+
+
 def test_final_variable_does_not_mask_runtime_error(monkeypatch):
     command = {
         "code": "Final = {'ok': True}\nraise RuntimeError('boom')",
@@ -146,3 +163,82 @@ def test_extracted_driver_source_runs_standalone(monkeypatch):
     messages = [json.loads(line) for line in raw_lines]
     assert len(messages) == 1
     assert messages[0]["final"] == {"status": "ok"}
+
+
+def test_make_send_writes_json_lines_and_tolerates_missing_stream():
+    from fleet_rlm.runtime.execution.driver_factories import make_send
+
+    proto_out = io.StringIO()
+    send = make_send(proto_out)
+    send({"stdout": "a"})
+    send({"stdout": "b"})
+
+    assert proto_out.getvalue() == '{"stdout": "a"}\n{"stdout": "b"}\n'
+    assert make_send(None)({"stdout": "ignored"}) is None
+
+
+def test_captures_interleaved_stdout_and_stderr(monkeypatch):
+    command = {
+        "code": (
+            "import sys\n"
+            "print('a', end='')\n"
+            "sys.stdout.write('b')\n"
+            "print('oops', file=sys.stderr)\n"
+            "print('c')"
+        ),
+    }
+    messages = _run_driver(monkeypatch, [json.dumps(command)])
+
+    assert messages[0]["stdout"] == "abc\n"
+    assert messages[0]["stderr"] == "oops\n"
+
+
+def test_repeated_code_reuses_compiled_snippet_and_reports_syntax_errors(monkeypatch):
+    increment = json.dumps({"code": "counter = globals().get('counter', 0) + 1"})
+    report = json.dumps({"code": "print(counter)"})
+    broken = json.dumps({"code": "def broken(:"})
+
+    messages = _run_driver(monkeypatch, [increment, increment, report, broken])
+
+    assert messages[2]["stdout"] == "2\n"
+    assert "SyntaxError" in messages[3]["stderr"]
+
+
+def test_streams_are_restored_after_each_command(monkeypatch):
+    original_stdout, original_stderr = sys.stdout, sys.stderr
+    command = {"code": "raise ValueError('bad')"}
+
+    messages = _run_driver(monkeypatch, [json.dumps(command)])
+
+    assert "ValueError: bad" in messages[0]["stderr"]
+    assert sys.stdout is original_stdout
+    assert sys.stderr is original_stderr
+
+
+def test_make_send_writes_whole_lines_to_file_descriptor(tmp_path):
+    from fleet_rlm.runtime.execution.driver_factories import make_send
+
+    target = tmp_path / "proto.jsonl"
+    with open(target, "w", encoding="utf-8") as proto_out:
+        proto_out.write("banner\n")
+        send = make_send(proto_out)
+        send({"stdout": "a" * 100_000})
+        send({"final": {"ok": True}})
+
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "banner"
+    assert json.loads(lines[1]) == {"stdout": "a" * 100_000}
+    assert json.loads(lines[2]) == {"final": {"ok": True}}
+
+
+def test_make_submit_stores_payload_in_final_slot():
+    from fleet_rlm.runtime.execution.driver_factories import FinalOutput, make_submit
+
+    slot: list[object] = []
+    submit = make_submit(["answer"], slot)
+
+    with pytest.raises(FinalOutput) as raised:
+        submit(42)
+
+    assert raised.value.args == ()
+    assert slot == [{"answer": 42}]
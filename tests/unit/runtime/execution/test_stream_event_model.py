@@ -96,6 +96,25 @@ def test_turn_state_apply_assistant_token():
     assert state.done is False
 
 
+def test_turn_state_transcript_text_tracks_tokens_after_read():
+    state = TurnState()
+    state.apply(StreamEvent(kind="assistant_token", text="Hello"))
+    assert state.transcript_text == "Hello"
+
+    state.apply(StreamEvent(kind="assistant_token", text=" again"))
+    assert state.transcript_text == "Hello again"
+
+
+def test_turn_state_transcript_text_rejoins_after_final_override():
+    state = TurnState()
+    state.apply(StreamEvent(kind="assistant_token", text="draft"))
+    state.apply(StreamEvent(kind="final", text="settled"))
+    assert state.transcript_text == "settled"
+
+    state.apply(StreamEvent(kind="assistant_token", text=" more"))
+    assert state.transcript_text == "draft more"
+
+
 def test_turn_state_apply_status():
     state = TurnState()
     state.apply(StreamEvent(kind="status", text="Calling tool: load_document"))
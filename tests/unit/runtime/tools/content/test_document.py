@@ -6,7 +6,7 @@ the closure-based DSPy tool builder that binds document ops to an agent.
 
 from __future__ import annotations
 
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from types import SimpleNamespace
 from typing import Any
 from unittest.mock import patch
@@ -250,6 +250,47 @@ def test_load_daytona_workspace_text_sync_rejects_parent_traversal(
     assert session.read_calls == []
 
 
+def test_load_daytona_workspace_text_sync_probes_file_info_before_listing(
+    tmp_path: Path,
+) -> None:
+    from fleet_rlm.runtime.tools.sandbox.common import (
+        _load_daytona_workspace_text_sync,
+        _SandboxToolContext,
+    )
+
+    class _InfoSession(FakeDaytonaWorkspaceSession):
+        def __init__(self) -> None:
+            super().__init__()
+            self.info_calls: list[str] = []
+
+        def get_file_info(self, path: str) -> Any:
+            self.info_calls.append(path)
+            if path not in self.files:
+                raise FileNotFoundError(path)
+            return SimpleNamespace(name=PurePosixPath(path).name, is_dir=False)
+
+    agent = _make_fake_agent(tmp_path)
+    session = _InfoSession()
+    session.files["/workspace/repo/paper.txt"] = "paper body"
+    agent.interpreter = FakeDaytonaWorkspaceInterpreter(session)
+    ctx = _SandboxToolContext(agent=agent)
+
+    with patch(
+        "fleet_rlm.runtime.tools.sandbox.common._get_daytona_session_sync",
+        return_value=session,
+    ):
+        loaded = _load_daytona_workspace_text_sync(ctx, path="paper.txt")
+        missing = _load_daytona_workspace_text_sync(ctx, path="missing.txt")
+
+    assert loaded == ("/workspace/repo/paper.txt", "paper body")
+    assert missing is None
+    assert session.info_calls == [
+        "/workspace/repo/paper.txt",
+        "/workspace/repo/missing.txt",
+    ]
+    assert session.list_calls == []
+
+
 def test_load_document_directory_returns_listing(tmp_path: Path):
     """load_document with a directory returns a file listing, not content."""
     from fleet_rlm.runtime.tools.content.document import build_document_tools
@@ -0,0 +1,101 @@
+"""Unit tests for the host filesystem ReAct tools."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from fleet_rlm.runtime.tools.filesystem import (
+    _MAX_FIND_HITS,
+    _FilesystemToolContext,
+    _find_files_impl,
+)
+
+
+def _install_fake_rg(bin_dir: Path, body: str) -> None:
+    bin_dir.mkdir(exist_ok=True)
+    script = bin_dir / "rg"
+    script.write_text(f"#!{sys.executable}\nimport sys\n{body}\n", encoding="utf-8")
+    script.chmod(0o755)
+
+
+def _match_line(index: int) -> str:
+    return json.dumps(
+        {
+            "type": "match",
+            "data": {
+                "path": {"text": f"file{index}.py"},
+                "line_number": index,
+                "lines": {"text": f"hit {index}\n"},
+            },
+        },
+        separators=(",", ":"),
+    )
+
+
+@pytest.fixture
+def ctx() -> _FilesystemToolContext:
+    return _FilesystemToolContext(agent=None)  # type: ignore[arg-type]
+
+
+def test_find_files_truncates_after_max_hits(tmp_path, monkeypatch, ctx) -> None:
+    lines = [json.dumps({"type": "begin", "data": {}})]
+    lines.extend(_match_line(index) for index in range(_MAX_FIND_HITS + 5))
+    _install_fake_rg(
+        tmp_path / "bin",
+        f"for line in {lines!r}:\n    print(line, flush=True)",
+    )
+    monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+
+    result = _find_files_impl(ctx, pattern="hit", path=".")
+
+    assert result["status"] == "ok"
+    assert result["truncated"] is True
+    assert result["count"] == _MAX_FIND_HITS
+    assert result["hits"][0] == {"path": "file0.py", "line": 0, "text": "hit 0"}
+    assert len(result["hits"]) == _MAX_FIND_HITS
+
+
+def test_find_files_reports_all_hits_below_the_cap(tmp_path, monkeypatch, ctx) -> None:
+    lines = [_match_line(index) for index in range(3)]
+    _install_fake_rg(
+        tmp_path / "bin",
+        f"for line in {lines!r}:\n    print(line)\nsys.exit(0)",
+    )
+    monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+
+    result = _find_files_impl(ctx, pattern="hit", path=".", include="*.py")
+
+    assert result["status"] == "ok"
+    assert result["truncated"] is False
+    assert result["count"] == 3
+    assert result["include"] == "*.py"
+
+
+def test_find_files_surfaces_ripgrep_errors(tmp_path, monkeypatch, ctx) -> None:
+    _install_fake_rg(
+        tmp_path / "bin",
+        "sys.stderr.write('regex parse error\\n')\nsys.exit(2)",
+    )
+    monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+
+    result = _find_files_impl(ctx, pattern="(", path=".")
+
+    assert result == {
+        "status": "error",
+        "pattern": "(",
+        "path": ".",
+        "error": "regex parse error",
+    }
+
+
+def test_find_files_reports_missing_ripgrep(tmp_path, monkeypatch, ctx) -> None:
+    monkeypatch.setenv("PATH", str(tmp_path))
+
+    result = _find_files_impl(ctx, pattern="hit", path=".")
+
+    assert result["status"] == "error"
+    assert result["error"].startswith("ripgrep (rg) is not available:")
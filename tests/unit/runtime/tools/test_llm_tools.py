@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import threading
 from types import SimpleNamespace
 
 import pytest
 
 from fleet_rlm.runtime.agent import RLMReActChatAgent
 from fleet_rlm.runtime.agent.delegation_policy import RuntimeModuleExecutionResult
+from fleet_rlm.runtime.execution.interpreter_support import (
+    initialize_llm_query_state,
+)
 from fleet_rlm.runtime.tools.llm_tools import (
+    LLMQueryMixin,
+    _lm_response_text,
     run_cached_runtime_module,
     runtime_metadata,
 )
@@ -17,6 +23,19 @@ from tests.unit.fixtures_react import FakeInterpreter
 pytestmark = pytest.mark.usefixtures("react_records")
 
 
+class _QueryHost(LLMQueryMixin):
+    def __init__(
+        self, *, sub_lm=None, max_llm_calls: int = 4, fail_fast: bool = True
+    ) -> None:
+        initialize_llm_query_state(
+            self,
+            sub_lm=sub_lm,
+            max_llm_calls=max_llm_calls,
+            llm_call_timeout=5,
+            llm_batch_fail_fast=fail_fast,
+        )
+
+
 def test_run_cached_runtime_module_uses_shared_delegation_policy(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -156,3 +175,96 @@ def test_run_cached_runtime_module_returns_error_payloads(
     assert prediction is None
     assert error == {"status": "error", "error": "boom"}
     assert fallback_used is False
+
+
+def test_check_and_increment_llm_calls_enforces_budget() -> None:
+    host = _QueryHost(max_llm_calls=4)
+
+    host._check_and_increment_llm_calls(3)
+    with pytest.raises(RuntimeError, match="LLM call limit exceeded: 3 \\+ 2 > 4"):
+        host._check_and_increment_llm_calls(2)
+    host._check_and_increment_llm_calls(1)
+
+    assert host._llm_call_count == 4
+    assert host._remaining_llm_budget() == 0
+
+
+def test_query_sub_lm_bounds_timeout_aware_lms_with_runtime_error() -> None:
+    release = threading.Event()
+
+    def slow_lm(prompt: str, timeout: float | None = None) -> list[str]:
+        release.wait(timeout=5)
+        return ["late"]
+
+    host = _QueryHost(sub_lm=slow_lm)
+    host.llm_call_timeout = 0.05
+
+    try:
+        with pytest.raises(RuntimeError, match="LLM call timed out after 0.05s"):
+            host._query_sub_lm("hi")
+    finally:
+        release.set()
+
+
+def test_query_sub_lm_uses_a_per_interpreter_executor() -> None:
+    host = _QueryHost(sub_lm=lambda prompt: [{"text": f"echo {prompt}"}])
+
+    assert host._query_sub_lm("hi") == "echo hi"
+    assert host._sub_lm_executor is not None
+
+    other = _QueryHost(sub_lm=lambda prompt: "other", max_llm_calls=4)
+    assert other._query_sub_lm("x") == "other"
+    assert other._sub_lm_executor is not host._sub_lm_executor
+
+    executor = host._sub_lm_executor
+    host._shutdown_sub_lm_executor()
+    other._shutdown_sub_lm_executor()
+    assert host._sub_lm_executor is None
+    assert executor._shutdown
+
+
+def _flaky_lm(release: threading.Event):
+    def lm(prompt: str) -> str:
+        if prompt == "bad":
+            raise ValueError("boom")
+        if prompt == "slow":
+            release.wait(timeout=5)
+        return f"ok {prompt}"
+
+    return lm
+
+
+def test_llm_query_batched_fails_fast_on_first_error() -> None:
+    release = threading.Event()
+    host = _QueryHost(sub_lm=_flaky_lm(release), max_llm_calls=8)
+
+    try:
+        with pytest.raises(RuntimeError, match=r"failed for 1/3 prompts: prompt\[0\]"):
+            host.llm_query_batched(["bad", "slow", "slow"])
+    finally:
+        release.set()
+
+
+def test_llm_query_batched_aggregates_errors_without_fail_fast() -> None:
+    release = threading.Event()
+    release.set()
+    host = _QueryHost(sub_lm=_flaky_lm(release), max_llm_calls=8, fail_fast=False)
+
+    with pytest.raises(RuntimeError, match=r"failed for 2/3 prompts"):
+        host.llm_query_batched(["bad", "slow", "bad"])
+
+    assert host.llm_query_batched(["a", "b"]) == ["ok a", "ok b"]
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        (["plain"], "plain"),
+        ([{"text": "from dict", "logprobs": None}], "from dict"),
+        ([{"tool_calls": []}], "{'tool_calls': []}"),
+        ("bare", "bare"),
+        ([], "[]"),
+    ],
+)
+def test_lm_response_text_handles_dspy_response_shapes(response, expected) -> None:
+    assert _lm_response_text(response) == expected